@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from functools import cache
+from typing import Any, Iterable
+import asyncio
 import logging
 
 from langchain_core.language_models import FakeListChatModel
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import BaseMessage
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.messages import BaseMessage, SystemMessage
+from langchain_core.runnables import Runnable, RunnableConfig, ensure_config
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import StateGraph
@@ -24,19 +26,19 @@ You orchestrate data from CoinGecko, CryptoCompare news, Blockchair on-chain sta
 
 Response contract:
 - Always return valid JSON that matches:
-  {{"summary": "<concise headline>", "responses": [ {{ "type": "...", "content": "...", "data": {{...}}, "chart_type": "...", "options": {{...}} }} ]}}
+  {"summary": "<concise headline>", "responses": [ { "type": "...", "content": "...", "data": {...}, "chart_type": "...", "options": {...} } ]}
 - Supported component types: "text", "table", "chart", "metric_grid", "news_list", "alerts_panel", "portfolio", "watchlist", "follow_up".
 - Prefer a text component for narrative, a table for static comparisons, chart for time-series (line for normalized performance, candlestick+indicator for TA, donut for allocation).
 - Finish with a `follow_up` component that suggests the next best two prompts (e.g., "See ETH news", "Set RSI alert").
 
-Tooling heuristics:
-- Call `market_pulse` for top-level "what's happening" or category heatmap questions.
-- Call `asset_intel` when the user references any specific asset; it already bundles price, news, sentiment, and on-chain context.
-- Use `advanced_compare` for multi-asset performance/dev-activity/TPS requests; pair with a normalized performance chart.
-- Use `technical_analysis` for RSI/MACD style prompts (currently RSI). Describe whether the signal is overbought/oversold.
-- Use `onchain_activity` when the user explicitly asks about whales or network growth (BTC/ETH/LTC/DOGE/BCH).
-- When portfolio/watchlist/alert questions surface, consult `portfolio_snapshot`, `watchlist_status`, or `alert_status` (pass the current thread_id as user_id).
-- Fall back to `get_price_quotes`, `asset_overview`, or `fundamentals_snapshot` when lightweight stats are sufficient.
+Tool routing (tool | use when):
+market_pulse | "what's happening", market overview, category heatmap
+asset_intel | any specific asset (bundles price, news, sentiment, on-chain)
+advanced_compare | multi-asset performance, dev activity, TPS; add normalized line chart
+technical_analysis | RSI/MACD prompts (RSI only); say overbought/oversold
+onchain_activity | whales, network growth (BTC/ETH/LTC/DOGE/BCH)
+portfolio_snapshot, watchlist_status, alert_status | portfolio/watchlist/alerts; user_id = thread_id
+get_price_quotes, asset_overview, fundamentals_snapshot | lightweight stats fallback
 
 Conversation style:
 - Interpret the numbers: never dump data without context. Highlight causes (news, flows, category rotations).
@@ -44,6 +46,18 @@ Conversation style:
 - Keep tone confident, precise, and oriented toward next steps."""
 
 
+@cache
+def _make_gemini(model: str, api_key: str, temperature: float) -> ChatGoogleGenerativeAI:
+    """Return a process-wide Gemini client so rebuilds reuse its warm channel."""
+
+    logger.info("Initializing Gemini model=%s", model)
+    return ChatGoogleGenerativeAI(
+        model=model,
+        temperature=temperature,
+        google_api_key=api_key,
+    )
+
+
 class TestingToolAwareChatModel(FakeListChatModel):
     """Fake chat model that no-ops tool binding for tests."""
 
@@ -52,15 +66,81 @@ class TestingToolAwareChatModel(FakeListChatModel):
         return self
 
 
-def build_agent(
+class LLMBatcher:
+    """Coalesce concurrent agent turns into a single ``abatch`` call.
+
+    A turn that arrives while no batch is in flight is dispatched at once, so
+    a quiet server adds no latency. Turns arriving while a batch is in flight
+    are held for up to ``window_ms`` (or until ``batch_size`` are waiting) and
+    dispatched together. Each turn keeps its own config so callbacks and
+    streaming events still reach the right run.
+    """
+
+    def __init__(self, llm: Runnable, *, batch_size: int, window_ms: int) -> None:
+        self.llm = llm
+        self.batch_size = batch_size
+        self.window = window_ms / 1000
+        self._pending: list[tuple[list[BaseMessage], RunnableConfig, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def ainvoke(self, messages: list[BaseMessage], config: RunnableConfig) -> Any:
+        if self.batch_size <= 1:
+            return await self.llm.ainvoke(messages, config=config)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((messages, config, future))
+        if len(self._pending) >= self.batch_size or (
+            len(self._pending) == 1 and self._flush_handle is None and not self._tasks
+        ):
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._dispatch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, batch) -> None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Dispatching LLM batch size=%s", len(batch))
+        try:
+            results = await self.llm.abatch(
+                [messages for messages, _, _ in batch],
+                config=[config for _, config, _ in batch],
+                return_exceptions=True,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            results = [exc] * len(batch)
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+def build_agent_graph(
     settings: Settings,
     tools: Iterable,
     llm: BaseChatModel | None = None,
-    *,
-    checkpointer: BaseCheckpointSaver,
-):
-    """Compile the LangGraph agent with SQLite checkpointing."""
+) -> StateGraph:
+    """Assemble the uncompiled agent graph.
+
+    Binding tool schemas and constructing the LLM client is the expensive part,
+    so callers build this once and compile it against each checkpointer.
+    """
 
+    tools = list(tools)
     if llm is None:
         if settings.testing:
             logger.info("Initializing testing chat model")
@@ -68,29 +148,32 @@ def build_agent(
         else:
             if not settings.google_api_key:
                 raise ValueError("GOOGLE_API_KEY is required unless TESTING=1.")
-            logger.info("Initializing Gemini model=%s", settings.gemini_model)
-            llm = ChatGoogleGenerativeAI(
-                model=settings.gemini_model,
-                temperature=0.2,
-                google_api_key=settings.google_api_key,
-            )
+            llm = _make_gemini(settings.gemini_model, settings.google_api_key, 0.2)
 
-    llm_with_tools = llm.bind_tools(list(tools))
+    llm_with_tools = llm.bind_tools(tools)
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", SYSTEM_PROMPT),
-            MessagesPlaceholder(variable_name="messages"),
-        ]
+    # The system prompt is static, so build the message once instead of
+    # re-templating it on every turn.
+    system_message = SystemMessage(content=SYSTEM_PROMPT)
+
+    batcher = LLMBatcher(
+        llm_with_tools,
+        batch_size=settings.llm_batch_size,
+        window_ms=settings.llm_batch_window_ms,
     )
 
-    def agent_node(state: AgentState):
-        logger.debug("Agent node executing with %s messages", len(state.get("messages", [])))
-        rendered = prompt.format_messages(messages=state["messages"])
-        response: BaseMessage = llm_with_tools.invoke(rendered)
+    async def agent_node(state: AgentState):
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Agent node executing with %s messages", len(state.get("messages", [])))
+        response: BaseMessage = await batcher.ainvoke(
+            [system_message, *state["messages"]], ensure_config()
+        )
         return {"messages": [response]}
 
-    tool_node = ToolNode(list(tools))
+    # Tools stay synchronous (their services use blocking ``requests``); when the
+    # graph runs through ``ainvoke``/``astream_events`` ToolNode fans the calls
+    # of a single turn out to executor threads and gathers them concurrently.
+    tool_node = ToolNode(tools, handle_tool_errors=True)
     graph = StateGraph(AgentState)
     graph.add_node("agent", agent_node)
     graph.add_node("tools", tool_node)
@@ -98,5 +181,18 @@ def build_agent(
     graph.add_edge("tools", "agent")
     graph.set_entry_point("agent")
 
-    logger.info("LangGraph compiled with %s tools", len(list(tools)))
-    return graph.compile(checkpointer=checkpointer)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("LangGraph assembled with %s tools", len(tools))
+    return graph
+
+
+def build_agent(
+    settings: Settings,
+    tools: Iterable,
+    llm: BaseChatModel | None = None,
+    *,
+    checkpointer: BaseCheckpointSaver,
+):
+    """Compile the LangGraph agent with SQLite checkpointing."""
+
+    return build_agent_graph(settings, tools, llm).compile(checkpointer=checkpointer)
@@ -0,0 +1,224 @@
+"""Caching helpers shared by the upstream API clients."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from functools import wraps
+from typing import Any, Callable, Hashable, Protocol, TypeVar
+import logging
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class FileCache:
+    """Gzip-compressed JSON cache on disk that survives process restarts.
+
+    Entries live under ``root/<endpoint>/<md5(key)>.json.gz`` and carry their
+    own timestamp and TTL, so an expired file is simply treated as a miss.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _path(self, namespace: str, key: Any) -> Path:
+        digest = hashlib.md5(orjson.dumps(key, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        folder = namespace.strip("/").replace("/", "_") or "root"
+        return self.root / folder / f"{digest}.json.gz"
+
+    def get(self, namespace: str, key: Any) -> Any | None:
+        path = self._path(namespace, key)
+        try:
+            entry = orjson.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, EOFError) as exc:
+            # EOFError: a truncated gzip stream, e.g. from a crashed writer.
+            logger.warning("Discarding unreadable cache entry %s: %s", path, exc)
+            return None
+        if time.time() - entry.get("ts", 0) >= entry.get("ttl", 0):
+            return None
+        return entry.get("payload")
+
+    def set(self, namespace: str, key: Any, payload: Any, ttl: float) -> None:
+        path = self._path(namespace, key)
+        entry = {"ts": time.time(), "ttl": ttl, "payload": payload}
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Unique per process *and* thread: pooled clients can miss on the
+            # same key concurrently and must not share a partial temp file.
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(gzip.compress(orjson.dumps(entry), compresslevel=5))
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.warning("Could not write cache entry %s: %s", path, exc)
+
+
+class TTLCache:
+    """Thread-safe, size-bounded LRU mapping whose entries expire after ``ttl``."""
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or time.monotonic() >= entry[0]:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def cache_info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+        }
+
+
+class CacheBackend(Protocol):
+    """Key/value store shared by every worker process."""
+
+    def get(self, key: str) -> Any | None: ...
+
+    def set(self, key: str, value: Any, ttl: float) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+
+class RedisCacheBackend:
+    """Redis-backed :class:`CacheBackend` storing orjson-encoded values.
+
+    Failures are logged and treated as misses so a Redis outage only costs
+    extra upstream calls.
+    """
+
+    def __init__(self, url: str, *, prefix: str = "cranalyst:") -> None:
+        import redis  # optional dependency, only needed when REDIS_URL is set
+
+        self._errors = (redis.RedisError,)
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Any | None:
+        try:
+            raw = self._client.get(self.prefix + key)
+        except self._errors as exc:
+            logger.warning("Redis get failed key=%s: %s", key, exc)
+            return None
+        return orjson.loads(raw) if raw else None
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        try:
+            self._client.set(
+                self.prefix + key,
+                orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS),
+                ex=max(1, int(ttl)),
+            )
+        except self._errors as exc:
+            logger.warning("Redis set failed key=%s: %s", key, exc)
+
+    def delete(self, key: str) -> None:
+        try:
+            self._client.delete(self.prefix + key)
+        except self._errors as exc:
+            logger.warning("Redis delete failed key=%s: %s", key, exc)
+
+    def add(self, key: str, value: Any, ttl: float) -> bool:
+        """Set ``key`` only if it is absent (``SET NX PX``); used as a lock."""
+
+        try:
+            return bool(
+                self._client.set(
+                    self.prefix + key,
+                    orjson.dumps(value),
+                    nx=True,
+                    px=max(1, int(ttl * 1000)),
+                )
+            )
+        except self._errors as exc:
+            logger.warning("Redis add failed key=%s: %s", key, exc)
+            # Without Redis there is nobody to coordinate with; let the caller compute.
+            return True
+
+
+def memoize(
+    backend: CacheBackend | None,
+    namespace: str,
+    ttl: float,
+    *,
+    lock_ttl: float = 10.0,
+    wait: float = 2.0,
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Cache a function's JSON-serialisable result in ``backend`` for ``ttl`` seconds.
+
+    Keys hash the call arguments under ``namespace``. Exceptions are never
+    cached. When the backend supports ``add`` (Redis ``SET NX``), only one
+    worker recomputes an expired entry while the others briefly wait for it.
+    Passing ``backend=None`` returns the function unchanged.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        if backend is None:
+            return func
+        add = getattr(backend, "add", None)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            digest = hashlib.sha1(
+                orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+            ).hexdigest()
+            key = f"{namespace}:{digest}"
+            cached = backend.get(key)
+            if cached is not None:
+                return cached
+            lock_key = f"lock:{key}"
+            owns_lock = add is not None and add(lock_key, 1, lock_ttl)
+            if add is not None and not owns_lock:
+                deadline = time.monotonic() + wait
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    cached = backend.get(key)
+                    if cached is not None:
+                        return cached
+            try:
+                result = func(*args, **kwargs)
+                backend.set(key, result, ttl)
+            finally:
+                if owns_lock:
+                    backend.delete(lock_key)
+            return result
+
+        return wrapper
+
+    return decorator
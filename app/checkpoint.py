@@ -0,0 +1,65 @@
+"""SQLite checkpoint saver that spreads reads across a connection pool."""
+
+from __future__ import annotations
+
+from itertools import cycle
+from typing import Any, AsyncIterator, Sequence
+
+import aiosqlite
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import CheckpointTuple
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+
+class PooledSqliteSaver(AsyncSqliteSaver):
+    """Checkpoint saver with one writer connection and N read-only readers.
+
+    aiosqlite funnels every statement on a connection through one worker
+    thread, so concurrent turns used to queue behind each other's checkpoint
+    writes. Under WAL, readers on separate connections proceed while the
+    writer commits; ``aget_tuple``/``alist`` round-robin across them and every
+    write still goes through the inherited single-connection path.
+    """
+
+    def __init__(
+        self,
+        conn: aiosqlite.Connection,
+        readers: Sequence[aiosqlite.Connection] = (),
+    ) -> None:
+        super().__init__(conn)
+        self.readers = [AsyncSqliteSaver(reader, serde=self.serde) for reader in readers]
+        self._reader_cycle = cycle(self.readers) if self.readers else None
+
+    async def setup(self) -> None:
+        await super().setup()
+        # Tables are created by the writer; readers are query-only.
+        for reader in self.readers:
+            reader.is_setup = True
+
+    def _reader(self) -> AsyncSqliteSaver:
+        return next(self._reader_cycle) if self._reader_cycle else self
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        await self.setup()
+        reader = self._reader()
+        if reader is self:
+            return await super().aget_tuple(config)
+        return await reader.aget_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        await self.setup()
+        reader = self._reader()
+        source = (
+            super().alist(config, filter=filter, before=before, limit=limit)
+            if reader is self
+            else reader.alist(config, filter=filter, before=before, limit=limit)
+        )
+        async for item in source:
+            yield item
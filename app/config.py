@@ -3,61 +3,112 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+from functools import cache
 from pathlib import Path
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, ConfigDict
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_ALLOWED_ORIGINS = (
+    "http://localhost:5173,http://127.0.0.1:5173,http://localhost:8000,http://127.0.0.1:8000"
+)
 
-# Load environment variables from .env if present.
-load_dotenv(ROOT_DIR / ".env")
+
+@cache
+def _resolve_data_path(raw: str) -> Path:
+    """Resolve ``raw`` against the repo root and make sure its folder exists."""
+
+    candidate = Path(raw)
+    if not candidate.is_absolute():
+        candidate = ROOT_DIR / candidate
+    abs_path = candidate.resolve()
+    abs_path.parent.mkdir(parents=True, exist_ok=True)
+    return abs_path
 
 
 class Settings(BaseModel):
-    """Centralized application settings."""
+    """Centralized application settings.
+
+    Environment-backed defaults are read at instantiation time so values loaded
+    from ``.env`` by :func:`get_settings` are honoured.
+    """
 
     app_name: str = "Crypto Analyst Chatbot"
-    google_api_key: str | None = Field(default=os.getenv("GOOGLE_API_KEY"))
-    gemini_model: str = Field(default=os.getenv("GEMINI_MODEL", "gemini-2.0-flash"))
-    coingecko_api_key: str | None = Field(default=os.getenv("COINGECKO_API_KEY"))
+    google_api_key: str | None = Field(default_factory=lambda: os.getenv("GOOGLE_API_KEY"))
+    gemini_model: str = Field(
+        default_factory=lambda: os.getenv("GEMINI_MODEL", "gemini-2.0-flash")
+    )
+    coingecko_api_key: str | None = Field(
+        default_factory=lambda: os.getenv("COINGECKO_API_KEY")
+    )
     coingecko_base_url: str = "https://api.coingecko.com/api/v3"
-    sqlite_db_path: str = Field(default=os.getenv("SQLITE_DB_PATH", "checkpoints/agent.db"))
+    sqlite_db_path: str = Field(
+        default_factory=lambda: os.getenv("SQLITE_DB_PATH", "checkpoints/agent.db")
+    )
     data_store_path: str = Field(
-        default=os.getenv("DATA_STORE_PATH", "checkpoints/agent_state.json")
+        default_factory=lambda: os.getenv("DATA_STORE_PATH", "checkpoints/agent_state.db")
+    )
+    redis_url: str | None = Field(default_factory=lambda: os.getenv("REDIS_URL"))
+    cache_dir: str = Field(default_factory=lambda: os.getenv("CACHE_DIR", "checkpoints/cache"))
+    cryptocompare_api_key: str | None = Field(
+        default_factory=lambda: os.getenv("CRYPTOCOMPARE_API_KEY")
+    )
+    blockchair_api_key: str | None = Field(
+        default_factory=lambda: os.getenv("BLOCKCHAIR_API_KEY")
     )
-    cryptocompare_api_key: str | None = Field(default=os.getenv("CRYPTOCOMPARE_API_KEY"))
-    blockchair_api_key: str | None = Field(default=os.getenv("BLOCKCHAIR_API_KEY"))
     blockchair_base_url: str = "https://api.blockchair.com"
-    default_currency: str = Field(default=os.getenv("DEFAULT_CURRENCY", "usd"))
-    default_thread_id: str = Field(default=os.getenv("DEFAULT_THREAD_ID", "default-thread"))
-    request_timeout: int = Field(default=int(os.getenv("REQUEST_TIMEOUT", "15")))
-    testing: bool = Field(default=os.getenv("TESTING", "0") == "1")
+    default_currency: str = Field(default_factory=lambda: os.getenv("DEFAULT_CURRENCY", "usd"))
+    default_thread_id: str = Field(
+        default_factory=lambda: os.getenv("DEFAULT_THREAD_ID", "default-thread")
+    )
+    request_timeout: int = Field(
+        default_factory=lambda: int(os.getenv("REQUEST_TIMEOUT", "15"))
+    )
+    llm_batch_size: int = Field(default_factory=lambda: int(os.getenv("LLM_BATCH_SIZE", "8")))
+    llm_batch_window_ms: int = Field(
+        default_factory=lambda: int(os.getenv("LLM_BATCH_WINDOW_MS", "20"))
+    )
+    sqlite_reader_connections: int = Field(
+        default_factory=lambda: int(os.getenv("SQLITE_READER_CONNECTIONS", "4"))
+    )
+    wal_checkpoint_interval: float = Field(
+        default_factory=lambda: float(os.getenv("WAL_CHECKPOINT_INTERVAL", "30"))
+    )
+    allowed_origins: tuple[str, ...] = Field(
+        default_factory=lambda: tuple(
+            origin.strip()
+            for origin in os.getenv("ALLOWED_ORIGINS", DEFAULT_ALLOWED_ORIGINS).split(",")
+            if origin.strip()
+        )
+    )
+    log_level: str = Field(default_factory=lambda: os.getenv("LOG_LEVEL", "INFO").upper())
+    testing: bool = Field(default_factory=lambda: os.getenv("TESTING", "0") == "1")
 
     model_config = ConfigDict(frozen=True)
 
     @property
     def sqlite_path(self) -> Path:
         """Return the absolute path to the SQLite checkpoint file."""
-        candidate = Path(self.sqlite_db_path)
+        return _resolve_data_path(self.sqlite_db_path)
+
+    @property
+    def cache_path(self) -> Path:
+        """Return the directory used for the persistent HTTP cache."""
+        candidate = Path(self.cache_dir)
         if not candidate.is_absolute():
             candidate = ROOT_DIR / candidate
-        abs_path = candidate.resolve()
-        abs_path.parent.mkdir(parents=True, exist_ok=True)
-        return abs_path
+        return candidate.resolve()
 
     @property
     def data_store_file(self) -> Path:
         """Return the file path used for agent portfolio/watchlist state."""
-        candidate = Path(self.data_store_path)
-        if not candidate.is_absolute():
-            candidate = ROOT_DIR / candidate
-        candidate.parent.mkdir(parents=True, exist_ok=True)
-        return candidate.resolve()
+        return _resolve_data_path(self.data_store_path)
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
-    """Return a cached settings instance."""
+    """Return a cached settings instance, loading ``.env`` on first use."""
+    if os.getenv("SKIP_DOTENV") != "1":
+        load_dotenv(ROOT_DIR / ".env")
     return Settings()
@@ -6,14 +6,22 @@ import logging
 import os
 from logging.config import dictConfig
 
+_CONFIGURED = False
 
-def setup_logging() -> None:
-    """Configure application-wide logging."""
 
-    level = os.getenv("LOG_LEVEL", "INFO").upper()
-    if getattr(setup_logging, "_configured", False):
+def setup_logging(level: str | None = None) -> None:
+    """Configure application-wide logging.
+
+    ``level`` normally comes from :class:`~app.config.Settings` so a value set in
+    ``.env`` is honoured; without it ``LOG_LEVEL`` is read from the environment.
+    """
+
+    global _CONFIGURED
+    if _CONFIGURED:
         return
 
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+
     dictConfig(
         {
             "version": 1,
@@ -36,4 +44,4 @@ def setup_logging() -> None:
         }
     )
     logging.getLogger(__name__).debug("Logging configured at level %s", level)
-    setup_logging._configured = True
+    _CONFIGURED = True
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
+from functools import cache
 from pathlib import Path
+import asyncio
 import logging
 
 import aiosqlite
@@ -11,12 +14,14 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
-from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 
-from .agent import build_agent
+from .agent import build_agent_graph
+from .cache import FileCache, RedisCacheBackend
+from .checkpoint import PooledSqliteSaver
 from .config import Settings, get_settings
 from .logging_config import setup_logging
 from .market import CoinGeckoClient, MarketDataService
+from .responses import ORJSONResponse
 from .routes.chat import router as chat_router
 from .routes.market import router as market_router
 from .routes.user import router as user_router
@@ -37,6 +42,7 @@ FRONTEND_DIST = BASE_DIR / "frontend" / "dist"
 LEGACY_STATIC = BASE_DIR / "static"
 
 
+@cache
 def _resolve_static_dir() -> Path:
     if FRONTEND_DIST.exists():
         return FRONTEND_DIST
@@ -44,11 +50,70 @@ def _resolve_static_dir() -> Path:
     return LEGACY_STATIC
 
 
-STATIC_DIR = _resolve_static_dir()
+# Connection-scoped pragmas for the checkpoint DB: WAL keeps readers and the
+# writer from blocking each other and NORMAL sync only fsyncs at checkpoint.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=10737418240;"
+    "PRAGMA cache_size=-65536;"
+    "PRAGMA busy_timeout=3000;"
+    "PRAGMA wal_autocheckpoint=0;"
+)
+# Reader connections share the WAL-mode DB and refuse writes.
+SQLITE_READER_PRAGMAS = (
+    "PRAGMA query_only=1;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=10737418240;"
+    "PRAGMA cache_size=-16384;"
+    "PRAGMA busy_timeout=3000;"
+)
+# WAL size (in pages) past which the background checkpoint also truncates the file.
+WAL_TRUNCATE_PAGES = 4000
+# Dedicated connection for TRUNCATE: it never waits on busy readers, so a
+# checkpoint attempt cannot hold writers up for the full busy_timeout.
+SQLITE_TRUNCATE_PRAGMAS = "PRAGMA busy_timeout=0;"
 
-setup_logging()
 logger = logging.getLogger(__name__)
 
+
+async def _checkpoint_loop(
+    conn: aiosqlite.Connection,
+    lock: asyncio.Lock,
+    interval: float,
+    truncate_conn: aiosqlite.Connection,
+) -> None:
+    """Merge the WAL back into the DB off the request path.
+
+    Auto-checkpointing is disabled on the connection, so without this loop the
+    WAL would grow unbounded. PASSIVE never waits on readers; once a pass has
+    copied every frame and the WAL is large, a TRUNCATE resets the file. The
+    TRUNCATE runs outside the saver lock on ``truncate_conn`` (busy_timeout=0),
+    so with readers active it reports busy at once and is retried next pass.
+    """
+
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with lock:
+                async with conn.execute("PRAGMA wal_checkpoint(PASSIVE)") as cursor:
+                    busy, log, checkpointed = await cursor.fetchone()
+                await conn.commit()
+            logger.debug(
+                "WAL checkpoint busy=%s log=%s checkpointed=%s", busy, log, checkpointed
+            )
+            if not busy and log >= WAL_TRUNCATE_PAGES and checkpointed == log:
+                async with truncate_conn.execute("PRAGMA wal_checkpoint(TRUNCATE)") as cursor:
+                    truncate_busy, _, _ = await cursor.fetchone()
+                if truncate_busy:
+                    logger.debug("WAL truncate deferred; readers still active")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # pragma: no cover - keep the loop alive
+            logger.warning("WAL checkpoint failed: %s", exc)
+
+
 def create_app(
     settings_override: Settings | None = None,
     llm_override=None,
@@ -56,28 +121,38 @@ def create_app(
 ) -> FastAPI:
     """Instantiate the FastAPI application."""
 
+    # Settings first: get_settings loads .env, which may carry LOG_LEVEL.
     settings = settings_override or get_settings()
+    setup_logging(settings.log_level)
     logger.info("Booting FastAPI app with SQLite DB at %s", settings.sqlite_path)
+    disk_cache = FileCache(settings.cache_path)
     coingecko_client = CoinGeckoClient(
         base_url=settings.coingecko_base_url,
         api_key=settings.coingecko_api_key,
         timeout=settings.request_timeout,
+        cache=disk_cache,
+    )
+    shared_cache = RedisCacheBackend(settings.redis_url) if settings.redis_url else None
+    market_service = market_service_override or MarketDataService(
+        coingecko_client, shared_cache=shared_cache
     )
-    market_service = market_service_override or MarketDataService(coingecko_client)
     news_service = CryptoNewsService(
         api_key=settings.cryptocompare_api_key,
+        cache=disk_cache,
     )
     onchain_service = OnChainService(
         api_key=settings.blockchair_api_key,
         base_url=settings.blockchair_base_url,
+        cache=disk_cache,
     )
     technical_service = TechnicalAnalysisService(market_service)
     data_store = AgentDataStore(settings.data_store_file)
     portfolio_service = PortfolioService(data_store, market_service)
     alert_service = AlertService(data_store, market_service, technical_service, portfolio_service)
-    pulse_service = MarketPulseService(market_service, news_service)
+    pulse_service = MarketPulseService(market_service, news_service, cache=disk_cache)
     comparison_service = AdvancedComparisonService(market_service)
 
+    tool_executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="tools")
     tools = build_market_tools(
         market_service,
         news_service=news_service,
@@ -87,33 +162,79 @@ def create_app(
         alert_service=alert_service,
         pulse_service=pulse_service,
         comparison_service=comparison_service,
+        executor=tool_executor,
+        shared_cache=shared_cache,
     )
 
-    graph_tools = tools
+    # Assemble the graph once per app; each lifespan only compiles it against
+    # its freshly opened checkpointer.
+    agent_graph = build_agent_graph(settings, tools, llm=llm_override)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         logger.info("Starting lifespan context, opening checkpoint DB.")
         conn = await aiosqlite.connect(str(settings.sqlite_path))
-        checkpointer = AsyncSqliteSaver(conn)
-        app.state.graph = build_agent(
-            settings,
-            graph_tools,
-            llm=llm_override,
-            checkpointer=checkpointer,
+        await conn.executescript(SQLITE_PRAGMAS)
+        readers: list[aiosqlite.Connection] = []
+        for _ in range(settings.sqlite_reader_connections):
+            reader = await aiosqlite.connect(str(settings.sqlite_path))
+            await reader.executescript(SQLITE_READER_PRAGMAS)
+            readers.append(reader)
+        truncate_conn = await aiosqlite.connect(str(settings.sqlite_path))
+        await truncate_conn.executescript(SQLITE_TRUNCATE_PRAGMAS)
+        checkpointer = PooledSqliteSaver(conn, readers)
+        checkpoint_task = asyncio.create_task(
+            _checkpoint_loop(
+                conn, checkpointer.lock, settings.wal_checkpoint_interval, truncate_conn
+            )
         )
+        app.state.graph = agent_graph.compile(checkpointer=checkpointer)
         logger.info("LangGraph agent compiled and ready.")
+        warmup_task: asyncio.Task | None = None
+        if not settings.testing:
+            # Runs beside startup so a slow CoinGecko cannot delay readiness.
+            warmup_task = asyncio.create_task(asyncio.to_thread(market_service.warm_up))
         try:
             yield
         finally:
+            if warmup_task is not None and not warmup_task.done():
+                # The warm-up thread uses coingecko_client's session, which is
+                # closed below; give it a bounded chance to finish first.
+                await asyncio.wait({warmup_task}, timeout=settings.request_timeout)
+                if not warmup_task.done():
+                    logger.warning("Market data warm-up still running at shutdown.")
+                    warmup_task.cancel()
+            checkpoint_task.cancel()
+            try:
+                await checkpoint_task
+            except asyncio.CancelledError:
+                pass
+            for reader in readers:
+                await reader.close()
+            await truncate_conn.close()
             await conn.close()
+            if market_service_override is None:
+                # An injected service belongs to the caller.
+                market_service.close()
+            coingecko_client.close()
+            news_service.close()
+            onchain_service.close()
+            pulse_service.close()
+            alert_service.close()
+            data_store.close()
             app.state.graph = None
+            tool_executor.shutdown(wait=False, cancel_futures=True)
             logger.info("Checkpoint DB closed, graph torn down.")
 
-    app = FastAPI(title=settings.app_name, version="1.0.0", lifespan=lifespan)
+    app = FastAPI(
+        title=settings.app_name,
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=list(settings.allowed_origins),
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
@@ -132,14 +253,15 @@ def create_app(
     app.include_router(chat_router)
     app.include_router(market_router)
     app.include_router(user_router)
-    STATIC_DIR.mkdir(parents=True, exist_ok=True)
+    static_dir = _resolve_static_dir()
+    static_dir.mkdir(parents=True, exist_ok=True)
 
-    if STATIC_DIR == FRONTEND_DIST:
-        assets_dir = STATIC_DIR / "assets"
+    if static_dir == FRONTEND_DIST:
+        assets_dir = static_dir / "assets"
         if assets_dir.exists():
             app.mount("/assets", StaticFiles(directory=assets_dir), name="assets")
     else:
-        app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+        app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
     @app.get("/health")
     async def health():
@@ -147,13 +269,22 @@ def create_app(
 
     @app.get("/")
     async def root():
-        return FileResponse(STATIC_DIR / "index.html")
+        return FileResponse(static_dir / "index.html")
 
-    if (STATIC_DIR / "vite.svg").exists():
+    if (static_dir / "vite.svg").exists():
 
         @app.get("/vite.svg")
         async def vite_svg():
-            return FileResponse(STATIC_DIR / "vite.svg")
+            return FileResponse(static_dir / "vite.svg")
 
     return app
-app = create_app()
+
+
+def __getattr__(name: str):
+    # Build the ASGI app on first access (e.g. ``uvicorn app.main:app``) so
+    # importing this module stays side-effect free.
+    if name == "app":
+        instance = create_app()
+        globals()["app"] = instance
+        return instance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
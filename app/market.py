@@ -2,15 +2,23 @@
 
 from __future__ import annotations
 
-import statistics
+import math
+import threading
+from operator import itemgetter
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Iterable, List, Sequence
 import logging
 
+import orjson
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from .cache import CacheBackend, FileCache, TTLCache
 from .models import MarketComparison, PriceQuote, TrendingCoin
 
 logger = logging.getLogger(__name__)
@@ -20,6 +28,16 @@ class MarketDataError(RuntimeError):
     """Raised when market data cannot be retrieved."""
 
 
+# Endpoints whose payloads change slowly enough to persist across restarts.
+# Coin detail is deliberately absent: it is the live price source for overviews.
+DISK_CACHE_TTLS = {
+    "coins/list": 86400,
+    "search/trending": 120,
+}
+# Documented cap on ids per simple/price request.
+SIMPLE_PRICE_MAX_IDS = 100
+
+
 class CoinGeckoClient:
     """Lightweight CoinGecko REST client."""
 
@@ -29,22 +47,53 @@ class CoinGeckoClient:
         api_key: str | None = None,
         timeout: int = 15,
         session: requests.Session | None = None,
+        cache: FileCache | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.cache = cache
         self.api_key = api_key
         self.timeout = timeout
         self.session = session or requests.Session()
+        # Pooled keep-alive connections shared by the fan-out threads, with
+        # backoff on CoinGecko's rate-limit and transient 5xx responses.
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=["GET"],
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"accept": "application/json", "connection": "keep-alive"})
+        if self.api_key:
+            self.session.headers["x-cg-pro-api-key"] = self.api_key
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
 
     def _request(self, path: str, params: dict | None = None) -> dict:
+        cache_ttl = DISK_CACHE_TTLS.get(path) if self.cache else None
+        if cache_ttl:
+            cached = self.cache.get(path, params)
+            if cached is not None:
+                logger.debug("CoinGecko disk cache hit path=%s", path)
+                return cached
+        payload = self._fetch(path, params)
+        if cache_ttl:
+            self.cache.set(path, params, payload, cache_ttl)
+        return payload
+
+    def _fetch(self, path: str, params: dict | None = None) -> dict:
         url = f"{self.base_url}/{path.lstrip('/')}"
-        headers = {"accept": "application/json"}
-        if self.api_key:
-            headers["x-cg-pro-api-key"] = self.api_key
         try:
             logger.info("CoinGecko request path=%s params=%s", path, params)
-            response: Response = self.session.get(
-                url, params=params, headers=headers, timeout=self.timeout
-            )
+            response: Response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
             logger.debug("CoinGecko response status=%s path=%s", response.status_code, path)
         except requests.HTTPError as exc:
@@ -54,32 +103,43 @@ class CoinGeckoClient:
         except requests.RequestException as exc:  # pragma: no cover - thin wrapper
             raise MarketDataError(f"CoinGecko request failed: {exc}") from exc
         try:
-            return response.json()
-        except ValueError as exc:  # pragma: no cover - invalid payload
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as exc:  # pragma: no cover - invalid payload
             raise MarketDataError("CoinGecko returned invalid JSON") from exc
 
     def get_simple_price(self, assets: Sequence[str], currency: str) -> List[PriceQuote]:
-        params = {
-            "ids": ",".join(assets),
-            "vs_currencies": currency,
-            "include_24hr_change": "true",
-            "include_market_cap": "true",
-        }
-        payload = self._request("simple/price", params=params)
+        return list(self.get_simple_price_map(assets, currency).values())
+
+    def get_simple_price_map(
+        self, assets: Sequence[str], currency: str
+    ) -> dict[str, PriceQuote]:
+        """Return quotes keyed by asset id, built in the payload parsing pass."""
+
+        payload: dict = {}
+        for start in range(0, len(assets), SIMPLE_PRICE_MAX_IDS):
+            params = {
+                "ids": ",".join(assets[start : start + SIMPLE_PRICE_MAX_IDS]),
+                "vs_currencies": currency,
+                "include_24hr_change": "true",
+                "include_market_cap": "true",
+            }
+            payload.update(self._request("simple/price", params=params))
         logger.debug("Parsed price payload for assets=%s", assets)
-        quotes: list[PriceQuote] = []
+        change_key = f"{currency}_24h_change"
+        market_cap_key = f"{currency}_market_cap"
+        construct = PriceQuote.model_construct
+        quotes: dict[str, PriceQuote] = {}
         for asset, metrics in payload.items():
             price = metrics.get(currency)
             if price is None:
                 continue
-            quotes.append(
-                PriceQuote(
-                    asset=asset,
-                    currency=currency,
-                    price=float(price),
-                    change_24h=metrics.get(f"{currency}_24h_change"),
-                    market_cap=metrics.get(f"{currency}_market_cap"),
-                )
+            # CoinGecko payloads are trusted; skip pydantic validation.
+            quotes[asset] = construct(
+                asset=asset,
+                currency=currency,
+                price=float(price),
+                change_24h=metrics.get(change_key),
+                market_cap=metrics.get(market_cap_key),
             )
         return quotes
 
@@ -91,7 +151,7 @@ class CoinGeckoClient:
         for entry in coins:
             item = entry.get("item", {})
             trending.append(
-                TrendingCoin(
+                TrendingCoin.model_construct(
                     name=item.get("name", "Unknown"),
                     symbol=item.get("symbol", "").upper(),
                     score=entry.get("score", 0),
@@ -119,7 +179,7 @@ class CoinGeckoClient:
             "market_data": "true",
             "community_data": "false",
             "developer_data": "false",
-            "sparkline": "false",
+            "sparkline": "true",
         }
         return self._request(f"coins/{asset}", params=params)
 
@@ -145,6 +205,32 @@ class CoinGeckoClient:
         return self._request("coins/markets", params=params)
 
 
+def _timestamped_points(
+    points: Iterable[Sequence[float]], *, rebase: float | None = None
+) -> list[dict]:
+    """Convert CoinGecko ``[ms, value]`` pairs into timestamp/value dicts.
+
+    With ``rebase`` each value becomes its percentage change from that base,
+    rounded to two decimals. Lookups are bound to locals because charts can
+    hold thousands of points.
+    """
+
+    fromtimestamp = datetime.fromtimestamp
+    utc = timezone.utc
+    factor = 100 / rebase if rebase else None
+    data: list[dict] = []
+    append = data.append
+    for ts, value in points:
+        try:
+            iso = fromtimestamp(ts / 1000, utc).isoformat()
+        except (ValueError, TypeError):
+            continue
+        if factor is not None:
+            value = round((value - rebase) * factor, 2)
+        append({"timestamp": iso, "value": value})
+    return data
+
+
 COMMON_ASSET_OVERRIDES = {
     "btc": "bitcoin",
     "eth": "ethereum",
@@ -157,34 +243,179 @@ COMMON_ASSET_OVERRIDES = {
     "xrp": "ripple",
     "ltc": "litecoin",
 }
+# Ids that resolve to themselves without loading the multi-MB coin registry.
+KNOWN_COIN_IDS = frozenset(COMMON_ASSET_OVERRIDES.values())
 
 
 class MarketDataService:
     """High-level helpers that transform CoinGecko responses."""
 
-    def __init__(self, client: CoinGeckoClient) -> None:
+    def __init__(
+        self,
+        client: CoinGeckoClient,
+        *,
+        max_workers: int = 8,
+        shared_cache: CacheBackend | None = None,
+    ) -> None:
         self.client = client
-        self._symbol_cache: dict[str, list[str]] = {}
+        # Optional cross-process tier behind the in-process caches.
+        self.shared_cache = shared_cache
+        # CoinGecko calls are I/O bound; independent ones are fanned out here
+        # so a multi-call view costs max(RTT) rather than sum(RTT).
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="coingecko"
+        )
+        self._symbol_to_id: dict[str, str] = {}
         self._coin_ids: set[str] = set()
         self._cache_expiry = 0.0
         self.cache_ttl_seconds = 3600
-        self._overview_cache: dict[tuple[str, str, int], tuple[float, dict]] = {}
         self.overview_cache_ttl = 60
-        self._comparison_cache: dict[
-            tuple[str, tuple[str, ...], str], tuple[float, list[MarketComparison]]
-        ] = {}
+        self._overview_cache = TTLCache(maxsize=512, ttl=self.overview_cache_ttl)
         self.comparison_cache_ttl = 60
+        self._comparison_cache = TTLCache(maxsize=512, ttl=self.comparison_cache_ttl)
+        self._trending_cache = TTLCache(maxsize=1, ttl=30)
+        self._price_cache: dict[tuple[str, str], tuple[float, PriceQuote]] = {}
+        self._price_inflight: dict[tuple[str, str], Future] = {}
+        self._price_lock = threading.Lock()
+        self.price_cache_ttl = 30
+        self._inflight: dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Stop the fan-out workers; the client is closed by its owner."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def cache_info(self) -> dict:
+        """Return hit/miss counters for the response caches."""
+        return {
+            "overview": self._overview_cache.cache_info(),
+            "comparison": self._comparison_cache.cache_info(),
+            "trending": self._trending_cache.cache_info(),
+        }
 
     def summarize_prices(self, assets: Sequence[str], currency: str) -> list[PriceQuote]:
         assets = self._resolve_assets(assets)
         if not assets:
             raise ValueError("At least one asset symbol is required.")
         logger.info("Summarize prices assets=%s currency=%s", assets, currency)
-        return self.client.get_simple_price(assets, currency)
+        quotes = self._quote_map(assets, currency)
+        return [quotes[asset] for asset in dict.fromkeys(assets) if asset in quotes]
+
+    def _quote_map(self, asset_ids: Sequence[str], currency: str) -> dict[str, PriceQuote]:
+        """Return quotes keyed by asset id from a short-lived shared memo.
+
+        Fresh quotes are served from memory, assets already being fetched by
+        another thread are awaited rather than re-requested, and the rest go
+        out in a single batched ``simple/price`` call. When that call fails,
+        previously seen quotes are served stale if every asset has one.
+        """
+
+        now = time.monotonic()
+        quotes: dict[str, PriceQuote] = {}
+        waiting: list[tuple[str, Future]] = []
+        missing: list[str] = []
+        owned = Future()
+        with self._price_lock:
+            for asset in dict.fromkeys(asset_ids):
+                key = (asset, currency)
+                cached = self._price_cache.get(key)
+                if cached and now - cached[0] < self.price_cache_ttl:
+                    quotes[asset] = cached[1]
+                elif key in self._price_inflight:
+                    waiting.append((asset, self._price_inflight[key]))
+                else:
+                    self._price_inflight[key] = owned
+                    missing.append(asset)
+
+        if missing:
+            try:
+                fetched = self.client.get_simple_price_map(missing, currency)
+            except Exception as exc:
+                with self._price_lock:
+                    for asset in missing:
+                        self._price_inflight.pop((asset, currency), None)
+                    stale = {
+                        asset: self._price_cache[(asset, currency)][1]
+                        for asset in missing
+                        if (asset, currency) in self._price_cache
+                    }
+                owned.set_exception(exc)
+                if not isinstance(exc, MarketDataError) or len(stale) < len(missing):
+                    raise
+                logger.warning("CoinGecko price fetch failed (%s); serving stale quotes", exc)
+                fetched = stale
+            else:
+                stamp = time.monotonic()
+                with self._price_lock:
+                    for asset, quote in fetched.items():
+                        self._price_cache[(asset, currency)] = (stamp, quote)
+                    for asset in missing:
+                        self._price_inflight.pop((asset, currency), None)
+                owned.set_result(fetched)
+            quotes.update(fetched)
+
+        retry: list[str] = []
+        for asset, future in waiting:
+            try:
+                result = future.result(timeout=self.client.timeout)
+            except Exception as exc:
+                logger.debug("Coalesced price fetch for %s unavailable: %s", asset, exc)
+                retry.append(asset)
+                continue
+            if asset in result:
+                quotes[asset] = result[asset]
+        if retry:
+            # The owning request failed or stalled; fetch these directly.
+            quotes.update(self.client.get_simple_price_map(retry, currency))
+        return quotes
+
+    def _coalesce(self, key: tuple, build, *args):
+        """Run ``build(*args)`` once for concurrent callers sharing ``key``.
+
+        The first caller builds; callers arriving while it is in flight wait on
+        its future and share the result (or exception) instead of repeating
+        the upstream requests. A waiter whose builder stalls past the client
+        timeout builds for itself rather than pinning its worker thread.
+        """
+
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                owned = self._inflight[key] = Future()
+        if inflight is not None:
+            logger.debug("Joining in-flight build for %s", key)
+            try:
+                return inflight.result(timeout=self.client.timeout)
+            except FutureTimeoutError:
+                logger.warning("In-flight build for %s stalled; building directly", key)
+                return build(*args)
+        try:
+            result = build(*args)
+        except BaseException as exc:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+            owned.set_exception(exc)
+            raise
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        owned.set_result(result)
+        return result
 
     def get_trending(self) -> list[TrendingCoin]:
+        cached = self._trending_cache.get("trending")
+        if cached is not None:
+            return cached
         logger.info("Fetching trending coins")
-        return self.client.get_trending()
+        trending = self.client.get_trending()
+        self._trending_cache["trending"] = trending
+        return trending
+
+    def is_supported(self, asset: str) -> bool:
+        try:
+            self._resolve_single_asset(asset.lower().strip())
+        except ValueError:
+            return False
+        return True
 
     def resolve_symbol(self, asset: str) -> str:
         resolved = self._resolve_assets([asset])
@@ -213,20 +444,14 @@ class MarketDataService:
 
     def normalized_history(self, assets: Sequence[str], currency: str, days: int = 90) -> list[dict]:
         series_collection: list[dict] = []
-        for asset in assets:
-            chart = self.client.get_market_chart(asset, currency, days)
+        charts = self._executor.map(
+            lambda asset: self.client.get_market_chart(asset, currency, days), assets
+        )
+        for asset, chart in zip(assets, charts):
             prices = chart.get("prices", [])
             if not prices:
                 continue
-            base = prices[0][1] or 1.0
-            normalized: list[dict] = []
-            for ts, price in prices:
-                value = ((price - base) / base) * 100 if base else 0.0
-                try:
-                    iso = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).isoformat()
-                except (ValueError, TypeError):
-                    continue
-                normalized.append({"timestamp": iso, "value": round(value, 2)})
+            normalized = _timestamped_points(prices, rebase=prices[0][1] or 1.0)
             if normalized:
                 series_collection.append({"asset": asset, "series": normalized})
         return series_collection
@@ -239,22 +464,18 @@ class MarketDataService:
         logger.info("Comparing base=%s targets=%s currency=%s", base, targets, currency)
         assets = [base_id, *target_ids]
         cache_key = (base_id, tuple(target_ids), currency)
-        now = time.time()
-        cached = self._comparison_cache.get(cache_key)
         try:
-            quotes = {
-                quote.asset: quote
-                for quote in self.client.get_simple_price(assets, currency)
-            }
+            quotes = self._quote_map(assets, currency)
         except MarketDataError as exc:
-            if cached and now - cached[0] < self.comparison_cache_ttl:
+            cached = self._comparison_cache.get(cache_key)
+            if cached is not None:
                 logger.warning(
                     "CoinGecko compare failed (%s); serving cached data for %s/%s",
                     exc,
                     base_id,
                     currency,
                 )
-                return cached[1]
+                return cached
             raise
         comparisons: list[MarketComparison] = []
         base_quote = quotes.get(base_id)
@@ -264,7 +485,7 @@ class MarketDataService:
             if base_quote and target_quote and target_quote.price:
                 spread = base_quote.price - target_quote.price
             comparisons.append(
-                MarketComparison(
+                MarketComparison.model_construct(
                     base=base_id,
                     target=target_id,
                     base_price=base_quote.price if base_quote else None,
@@ -272,44 +493,43 @@ class MarketDataService:
                     spread=spread,
                 )
             )
-        self._comparison_cache[cache_key] = (now, comparisons)
+        self._comparison_cache[cache_key] = comparisons
         return comparisons
 
     def fundamentals_snapshot(
         self, asset: str, currency: str, lookback_days: int = 7
     ) -> dict:
         asset_id = self._resolve_assets([asset])[0]
+        return self._coalesce(
+            ("fundamentals", asset_id, currency, lookback_days),
+            self._build_fundamentals,
+            asset_id,
+            currency,
+            lookback_days,
+        )
+
+    def _build_fundamentals(self, asset_id: str, currency: str, lookback_days: int) -> dict:
         chart = self.client.get_market_chart(asset_id, currency, lookback_days)
         logger.info(
             "Building fundamentals snapshot asset=%s currency=%s lookback=%s",
-            asset,
+            asset_id,
             currency,
             lookback_days,
         )
-        prices = [point[1] for point in chart.get("prices", [])]
-        market_caps = [point[1] for point in chart.get("market_caps", [])]
-        volumes = [point[1] for point in chart.get("total_volumes", [])]
+        value_of = itemgetter(1)
+        prices = list(map(value_of, chart.get("prices", [])))
+        market_caps = list(map(value_of, chart.get("market_caps", [])))
+        volumes = list(map(value_of, chart.get("total_volumes", [])))
 
-        def _stats(series: Iterable[float]) -> dict:
-            series = list(series)
+        def _stats(series: list[float]) -> dict:
             if not series:
                 return {"min": None, "max": None, "avg": None}
             return {
                 "min": min(series),
                 "max": max(series),
-                "avg": round(statistics.fmean(series), 4),
+                "avg": round(math.fsum(series) / len(series), 4),
             }
 
-        def _series(points: Iterable[List[float]]) -> list[dict]:
-            data: list[dict] = []
-            for ts, value in points:
-                try:
-                    iso = datetime.fromtimestamp(ts / 1000, tz=timezone.utc).isoformat()
-                except (ValueError, TypeError):
-                    continue
-                data.append({"timestamp": iso, "value": value})
-            return data
-
         snapshot = {
             "asset": asset_id,
             "currency": currency,
@@ -318,9 +538,9 @@ class MarketDataService:
             "volume_stats": _stats(volumes),
             "last_updated": datetime.now(timezone.utc).isoformat(),
             "series": {
-                "prices": _series(chart.get("prices", [])),
-                "market_caps": _series(chart.get("market_caps", [])),
-                "volumes": _series(chart.get("total_volumes", [])),
+                "prices": _timestamped_points(chart.get("prices", [])),
+                "market_caps": _timestamped_points(chart.get("market_caps", [])),
+                "volumes": _timestamped_points(chart.get("total_volumes", [])),
             },
         }
         return snapshot
@@ -328,38 +548,53 @@ class MarketDataService:
     def asset_overview(self, asset: str, currency: str, lookback_days: int = 7) -> dict:
         asset_id = self._resolve_assets([asset])[0]
         cache_key = (asset_id, currency, lookback_days)
-        now = time.time()
         cached = self._overview_cache.get(cache_key)
-        if cached and now - cached[0] < self.overview_cache_ttl:
+        if cached is not None:
             logger.debug("Serving cached overview for %s/%s", asset_id, currency)
-            return cached[1]
-
-        logger.info("Building asset overview for asset=%s currency=%s", asset, currency)
-        quotes = self.client.get_simple_price([asset_id], currency)
-        quote = quotes[0] if quotes else None
-        fundamentals = self.fundamentals_snapshot(asset, currency, lookback_days)
-        detail = self.client.get_coin_detail(asset_id)
+            return cached
+        shared_key = f"overview:{asset_id}:{currency}:{lookback_days}"
+        if self.shared_cache is not None:
+            cached = self.shared_cache.get(shared_key)
+            if cached is not None:
+                self._overview_cache[cache_key] = cached
+                return cached
+        # The agent often asks for the same asset through several tools at once.
+        return self._coalesce(("overview", *cache_key), self._build_overview, cache_key, shared_key)
+
+    def _build_overview(self, cache_key: tuple[str, str, int], shared_key: str) -> dict:
+        asset_id, currency, lookback_days = cache_key
+        logger.info("Building asset overview for asset=%s currency=%s", asset_id, currency)
+        fundamentals_future = self._executor.submit(
+            self.fundamentals_snapshot, asset_id, currency, lookback_days
+        )
+        detail_future = self._executor.submit(self.client.get_coin_detail, asset_id)
+        ohlc_future = self._executor.submit(
+            self.client.get_ohlc_chart, asset_id, currency, lookback_days
+        )
+        fundamentals = fundamentals_future.result()
+        detail = detail_future.result()
         market_data = detail.get("market_data", {})
 
-        # Fetch OHLC data
-        ohlc_data = self.client.get_ohlc_chart(asset_id, currency, lookback_days)
+        ohlc_data = ohlc_future.result()
         ohlc_series = [
             {"timestamp": p[0], "open": p[1], "high": p[2], "low": p[3], "close": p[4]}
             for p in ohlc_data
         ]
 
-        def _value(path, default=None):
-            try:
-                data = market_data
-                for key in path:
-                    data = data[key]
-                return data
-            except (KeyError, TypeError):
-                return default
-
-        current_price = quote.price if quote else _value(["current_price", currency])
-        change_24h = quote.change_24h if quote else _value(["price_change_percentage_24h"])
-        market_cap = quote.market_cap if quote else _value(["market_cap", currency])
+        def _in_currency(field: str):
+            # Per-currency fields are ``{field: {currency: value}}``; missing or
+            # null maps fall through to ``None``.
+            return (market_data.get(field) or {}).get(currency)
+
+        # coins/{id} already carries live price, change and market cap, so no
+        # separate simple/price round trip is needed.
+        current_price = _in_currency("current_price")
+        change_24h = _in_currency("price_change_percentage_24h_in_currency")
+        if change_24h is None:
+            # The top-level field is USD-based; only use it when the
+            # per-currency map is missing.
+            change_24h = market_data.get("price_change_percentage_24h")
+        market_cap = _in_currency("market_cap")
         sparkline = market_data.get("sparkline_7d", {}).get("price", [])
 
         overview = {
@@ -370,55 +605,65 @@ class MarketDataService:
             "price": current_price,
             "change_24h": change_24h,
             "market_cap": market_cap,
-            "volume_24h": _value(["total_volume", currency]),
+            "volume_24h": _in_currency("total_volume"),
             "market_cap_rank": market_data.get("market_cap_rank"),
             "circulating_supply": market_data.get("circulating_supply"),
             "total_supply": market_data.get("total_supply"),
             "max_supply": market_data.get("max_supply"),
-            "ath_price": _value(["ath", currency]),
-            "ath_change_pct": _value(["ath_change_percentage", currency]),
-            "atl_price": _value(["atl", currency]),
-            "atl_change_pct": _value(["atl_change_percentage", currency]),
+            "ath_price": _in_currency("ath"),
+            "ath_change_pct": _in_currency("ath_change_percentage"),
+            "atl_price": _in_currency("atl"),
+            "atl_change_pct": _in_currency("atl_change_percentage"),
             "last_updated": detail.get("last_updated"),
             "fundamentals": fundamentals,
             "sparkline": sparkline,
             "series": fundamentals.get("series", {}),
             "ohlc_series": ohlc_series,  # NEW: Add OHLC series here
         }
-        self._overview_cache[cache_key] = (now, overview)
+        self._overview_cache[cache_key] = overview
+        if self.shared_cache is not None:
+            self.shared_cache.set(shared_key, overview, self.overview_cache_ttl)
         return overview
 
     def _resolve_assets(self, assets: Sequence[str]) -> list[str]:
-        cleaned = [asset.lower().strip() for asset in assets if asset]
-        if not cleaned:
-            return []
-        resolved: list[str] = []
-        for asset in cleaned:
-            resolved.append(self._resolve_single_asset(asset))
-        return resolved
+        return [self._resolve_single_asset(asset.lower().strip()) for asset in assets if asset]
 
     def _resolve_single_asset(self, asset: str) -> str:
-        if asset in COMMON_ASSET_OVERRIDES:
-            return COMMON_ASSET_OVERRIDES[asset]
+        override = COMMON_ASSET_OVERRIDES.get(asset)
+        if override:
+            return override
+        if asset in KNOWN_COIN_IDS:
+            return asset
         self._ensure_registry()
         if asset in self._coin_ids:
             return asset
-        candidates = self._symbol_cache.get(asset)
-        if not candidates:
-            return asset
-        choice = self._pick_candidate(asset, candidates)
-        logger.debug("Resolved symbol %s -> %s", asset, choice)
-        return choice
+        coin_id = self._symbol_to_id.get(asset)
+        if coin_id:
+            return coin_id
+        if self._coin_ids:
+            # Fail locally rather than spend rate-limited calls on a guaranteed miss.
+            raise ValueError(f"Unsupported asset '{asset}'.")
+        # Registry unavailable; let CoinGecko be the judge.
+        return asset
 
     def _pick_candidate(self, symbol: str, candidates: list[str]) -> str:
         for candidate in candidates:
             if candidate.startswith(symbol):
                 return candidate
-        return sorted(candidates)[0]
+        return min(candidates)
+
+    def warm_up(self) -> None:
+        """Load the coin registry now so the first request skips the TLS
+        handshake and the ``coins/list`` download."""
+
+        try:
+            self._ensure_registry()
+        except Exception as exc:  # pragma: no cover - startup must not fail
+            logger.warning("Market data warm-up failed: %s", exc)
 
     def _ensure_registry(self) -> None:
-        now = time.time()
-        if now < self._cache_expiry and self._symbol_cache:
+        now = time.monotonic()
+        if now < self._cache_expiry and self._symbol_to_id:
             return
         try:
             coins = self.client.list_coins()
@@ -435,7 +680,11 @@ class MarketDataService:
                 id_set.add(coin_id)
             if symbol and coin_id:
                 symbol_map.setdefault(symbol, []).append(coin_id)
-        self._symbol_cache = symbol_map
+        # Pick each symbol's preferred id once here rather than per lookup.
+        self._symbol_to_id = {
+            symbol: self._pick_candidate(symbol, candidates)
+            for symbol, candidates in symbol_map.items()
+        }
         self._coin_ids = id_set
         self._cache_expiry = now + self.cache_ttl_seconds
         logger.info("Loaded %s coin identifiers into cache", len(id_set))
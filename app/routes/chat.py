@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import io
 import logging
 import re
-import re
-from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional
+from contextlib import suppress
+from typing import Any, AsyncGenerator, Dict, Iterable, List, Optional, Sequence
 
+import orjson
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from langchain_core.messages import (
@@ -25,9 +27,39 @@ from ..market import COMMON_ASSET_OVERRIDES
 router = APIRouter(prefix="/api/chat", tags=["chat"])
 logger = logging.getLogger(__name__)
 
-def _shorten(value: Any, limit: int = 160) -> str:
-    text = str(value)
-    return text if len(text) <= limit else text[:limit] + "…"
+def _dumps(value: Any) -> bytes:
+    return orjson.dumps(value, default=_jsonify, option=orjson.OPT_NON_STR_KEYS)
+
+
+# Pre-encoded SSE framing; each frame is a single bytes concatenation.
+MESSAGE_FRAME = b"data: "
+STATUS_FRAME = b"event: status\ndata: "
+VISUAL_FRAME = b"event: visual\ndata: "
+LAYOUT_FRAME = b"event: layout\ndata: "
+FRAME_END = b"\n\n"
+END_FRAME = b'data: {"event":"end"}\n\n'
+
+
+def _tool_name(event: dict) -> str:
+    return event.get("name") or (event.get("metadata") or {}).get("name") or "tool"
+
+
+class _Preview:
+    """Truncated ``str(value)`` for log arguments.
+
+    Logging only calls ``__str__`` when a record is emitted, so large tool
+    payloads are not stringified for suppressed levels.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int = 160) -> None:
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        text = str(self.value)
+        return text if len(text) <= self.limit else text[: self.limit] + "…"
 
 
 def _extract_ai_content(messages: Iterable) -> tuple[str, List[str]]:
@@ -35,7 +67,10 @@ def _extract_ai_content(messages: Iterable) -> tuple[str, List[str]]:
 
     content = ""
     tools_used: list[str] = []
-    for message in reversed(list(messages)):
+    # Graph results hand back a list; walk it from the tail without copying.
+    if not isinstance(messages, Sequence):
+        messages = list(messages)
+    for message in reversed(messages):
         if isinstance(message, AIMessage):
             content = _stringify_content(message.content)
             tool_calls = message.additional_kwargs.get("tool_calls", [])
@@ -61,17 +96,19 @@ def _stringify_content(content) -> str:
 
 
 def _jsonify(value: Any):
+    """``orjson`` fallback for messages nested anywhere in a tool payload.
+
+    orjson only calls this for objects it cannot encode natively, so plain
+    dict/list payloads are serialized without a Python-level walk.
+    """
+
     if isinstance(value, BaseMessage):
         return {
             "type": value.type,
             "content": _stringify_content(value.content),
             "additional_kwargs": value.additional_kwargs,
         }
-    if isinstance(value, dict):
-        return {key: _jsonify(val) for key, val in value.items()}
-    if isinstance(value, list):
-        return [_jsonify(item) for item in value]
-    return value
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 TOOL_EVENT_MAP = {
@@ -108,7 +145,14 @@ COMMON_NAME_OVERRIDES = {
 }
 
 CONTENT_TICKER_PATTERN = re.compile(r"\(([A-Z]{2,6})\)")
-UPPER_TICKER_PATTERN = re.compile(r"\b([A-Z]{2,6})\b")
+# Upper-case only, so words like "dot" or "sol" in prose do not match.
+KNOWN_TICKER_PATTERN = re.compile(
+    r"\b("
+    + "|".join(sorted(map(str.upper, COMMON_ASSET_OVERRIDES), key=len, reverse=True))
+    + r")\b"
+)
+# One scan for any known coin name; matches the same substrings the names do.
+COMMON_NAME_PATTERN = re.compile("|".join(map(re.escape, COMMON_NAME_OVERRIDES)))
 
 
 def _register_hydrator(component_type: str):
@@ -139,15 +183,12 @@ def _determine_asset(component: UIComponent) -> Optional[str]:
         match = CONTENT_TICKER_PATTERN.search(content)
         if match:
             return match.group(1).lower()
-        match = UPPER_TICKER_PATTERN.search(content)
+        match = KNOWN_TICKER_PATTERN.search(content)
         if match:
-            token = match.group(1).lower()
-            if token in COMMON_ASSET_OVERRIDES:
-                return token
-        lowered = content.lower()
-        for name, slug in COMMON_NAME_OVERRIDES.items():
-            if name in lowered:
-                return slug
+            return match.group(1).lower()
+        match = COMMON_NAME_PATTERN.search(content.lower())
+        if match:
+            return COMMON_NAME_OVERRIDES[match.group(0)]
     return None
 
 
@@ -189,24 +230,22 @@ def _hydrate_asset_intel(component: UIComponent, state) -> Optional[dict]:
         onchain = (component.data or {}).get("onchain")
         errors.append("On-chain data unavailable for this asset.")
 
-    response_data = dict(component.data or {})
-    response_data.update(
-        {
-            "asset": asset,
-            "overview": overview,
-            "news": [
-                {
-                    "title": item.title,
-                    "source": item.source,
-                    "url": item.url,
-                    "published_at": item.published_at,
-                }
-                for item in news_items
-            ],
-            "sentiment": sentiment,
-            "onchain": onchain,
-        }
-    )
+    response_data = {
+        **(component.data or {}),
+        "asset": asset,
+        "overview": overview,
+        "news": [
+            {
+                "title": item.title,
+                "source": item.source,
+                "url": item.url,
+                "published_at": item.published_at,
+            }
+            for item in news_items
+        ],
+        "sentiment": sentiment,
+        "onchain": onchain,
+    }
 
     candlestick_series = []
     if overview and overview.get("ohlc_series"):
@@ -222,18 +261,31 @@ def _hydrate_asset_intel(component: UIComponent, state) -> Optional[dict]:
     return response_data
 
 
-def _hydrate_structured(structured: AgentStructuredResponse, state) -> AgentStructuredResponse:
+async def _hydrate_structured(
+    structured: AgentStructuredResponse, state
+) -> AgentStructuredResponse:
     if not structured or not structured.responses:
         return structured
-    for component in structured.responses:
-        hydrator = COMPONENT_HYDRATORS.get(component.type)
-        if hydrator:
-            try:
-                hydrated = hydrator(component, state)
-                if hydrated:
-                    component.data = hydrated
-            except Exception as exc:
-                logger.warning("Component hydration failed type=%s error=%s", component.type, exc)
+    pending = [
+        (component, hydrator)
+        for component in structured.responses
+        if (hydrator := COMPONENT_HYDRATORS.get(component.type))
+    ]
+    if not pending:
+        return structured
+    # Hydrators make blocking upstream calls; run them side by side so several
+    # components cost the slowest one rather than the sum.
+    results = await asyncio.gather(
+        *(asyncio.to_thread(hydrator, component, state) for component, hydrator in pending),
+        return_exceptions=True,
+    )
+    for (component, _), hydrated in zip(pending, results):
+        if isinstance(hydrated, Exception):
+            logger.warning(
+                "Component hydration failed type=%s error=%s", component.type, hydrated
+            )
+        elif hydrated:
+            component.data = hydrated
     return structured
 
 
@@ -247,16 +299,17 @@ def _serialize_tool_payload(tool_name: str, payload: Any) -> Dict[str, Any]:
             stripped.startswith("[") and stripped.endswith("]")
         ):
             try:
-                extracted = json.loads(stripped)
-            except json.JSONDecodeError:
+                extracted = orjson.loads(stripped)
+            except orjson.JSONDecodeError:
                 pass
     return {
         "type": TOOL_EVENT_MAP.get(tool_name, tool_name),
-        "payload": _jsonify(extracted),
+        "payload": extracted,
     }
 
 
 CODE_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*([\s\S]+?)\s*```", re.IGNORECASE)
+JSON_PREFIX_PATTERN = re.compile(r"^json\b[:=\s-]*", re.IGNORECASE)
 
 
 def _strip_code_fences(value: str) -> str:
@@ -267,17 +320,39 @@ def _strip_code_fences(value: str) -> str:
     trimmed = value.strip()
     match = CODE_BLOCK_PATTERN.search(trimmed)
     candidate = match.group(1) if match else trimmed
-    candidate = re.sub(r"^json\b[:=\s-]*", "", candidate, flags=re.IGNORECASE)
+    candidate = JSON_PREFIX_PATTERN.sub("", candidate)
     return candidate.strip()
 
 
+def _parse_structured(text: str) -> AgentStructuredResponse:
+    # orjson decodes large component payloads faster than pydantic's reader.
+    return AgentStructuredResponse.model_validate(orjson.loads(text))
+
+
+def _has_content(structured: AgentStructuredResponse) -> bool:
+    return bool(structured.summary or structured.responses)
+
+
 def _ensure_structured(content: str) -> AgentStructuredResponse:
     if not content:
         logger.warning("Structured response fallback: empty content.")
         return AgentStructuredResponse(responses=[])
     try:
-        cleaned = _strip_code_fences(content)
-        structured = AgentStructuredResponse.model_validate_json(cleaned)
+        structured = None
+        # The outermost braces bracket the payload whether it arrives bare,
+        # fenced or behind a "json" label, so one find/rfind usually suffices.
+        start = content.find("{")
+        end = content.rfind("}")
+        if 0 <= start < end:
+            with suppress(ValidationError, ValueError, TypeError):
+                structured = _parse_structured(content[start : end + 1])
+        if structured is None or not _has_content(structured):
+            # Stray braces in surrounding prose; fall back to fence extraction.
+            structured = _parse_structured(_strip_code_fences(content))
+            if not _has_content(structured):
+                # Every field has a default, so any object validates; an
+                # object without summary or components is prose, not layout.
+                raise ValueError("Structured payload has no summary or responses.")
         logger.debug(
             "Structured payload parsed summary=%s responses=%s",
             structured.summary,
@@ -320,7 +395,7 @@ async def invoke_chat(payload: ChatRequest, request: Request):
         logger.error("Empty response from agent thread=%s", thread_id)
         raise HTTPException(status_code=500, detail="Agent returned an empty response.")
     structured = _ensure_structured(content)
-    structured = _hydrate_structured(structured, request.app.state)
+    structured = await _hydrate_structured(structured, request.app.state)
     logger.info(
         "Chat response thread=%s chars=%s tools=%s",
         thread_id,
@@ -338,46 +413,45 @@ async def invoke_chat(payload: ChatRequest, request: Request):
 
 async def _langgraph_event_stream(
     graph, state, message: str, thread_id: str
-) -> AsyncGenerator[str, None]:
+) -> AsyncGenerator[bytes, None]:
     logger.info("Starting SSE stream for thread=%s", thread_id)
     inputs = {"messages": [HumanMessage(content=message)]}
     config = {"configurable": {"thread_id": thread_id}}
     yielded = False
-    buffer: list[str] = []
+    buffer = io.StringIO()
     async for event in graph.astream_events(inputs, config=config, version="v1"):
         kind = event.get("event")
         if kind == "on_chat_model_stream":
             chunk: AIMessageChunk = event["data"]["chunk"]
             text = _stringify_content(chunk.content)
             if text:
-                buffer.append(text)
+                buffer.write(text)
                 logger.debug(
                     "SSE chunk thread=%s size=%s preview=%s",
                     thread_id,
                     len(text),
-                    _shorten(text),
+                    _Preview(text),
                 )
-                payload = json.dumps({"chunk": text, "thread_id": thread_id})
-                yield f"data: {payload}\n\n"
+                yield MESSAGE_FRAME + _dumps({"chunk": text, "thread_id": thread_id}) + FRAME_END
                 yielded = True
         elif kind == "on_tool_start":
-            tool_name = event.get("name") or event.get("metadata", {}).get("name", "tool")
+            tool_name = _tool_name(event)
             logger.info("Tool start thread=%s tool=%s", thread_id, tool_name)
-            status_payload = json.dumps(
+            status_payload = _dumps(
                 {"tool": tool_name, "message": f"Running {tool_name}"}
             )
-            yield f"event: status\ndata: {status_payload}\n\n"
+            yield STATUS_FRAME + status_payload + FRAME_END
         elif kind == "on_tool_end":
-            tool_name = event.get("name") or event.get("metadata", {}).get("name", "tool")
+            tool_name = _tool_name(event)
             tool_output = event.get("data", {}).get("output")
             logger.info(
                 "Tool end thread=%s tool=%s payload_preview=%s",
                 thread_id,
                 tool_name,
-                _shorten(tool_output),
+                _Preview(tool_output),
             )
-            payload = json.dumps(_serialize_tool_payload(tool_name, tool_output))
-            yield f"event: visual\ndata: {payload}\n\n"
+            payload = _dumps(_serialize_tool_payload(tool_name, tool_output))
+            yield VISUAL_FRAME + payload + FRAME_END
     if not yielded:
         logger.warning(
             "Model produced no streaming chunks; falling back to ainvoke thread=%s",
@@ -385,21 +459,20 @@ async def _langgraph_event_stream(
         )
         result = await graph.ainvoke(inputs, config=config)
         content, _ = _extract_ai_content(result.get("messages", []))
-        buffer.append(content or "")
+        buffer.write(content or "")
         if content:
-            payload = json.dumps({"chunk": content, "thread_id": thread_id})
-            yield f"data: {payload}\n\n"
-    structured = _ensure_structured("".join(buffer))
-    structured = _hydrate_structured(structured, state)
-    layout_payload = json.dumps(structured.model_dump())
+            yield MESSAGE_FRAME + _dumps({"chunk": content, "thread_id": thread_id}) + FRAME_END
+    structured = _ensure_structured(buffer.getvalue())
+    structured = await _hydrate_structured(structured, state)
+    layout_payload = structured.model_dump_json().encode()
     logger.info(
         "Emitting layout thread=%s summary=%s components=%s",
         thread_id,
         structured.summary,
         len(structured.responses),
     )
-    yield f"event: layout\ndata: {layout_payload}\n\n"
-    yield 'data: {"event":"end"}\n\n'
+    yield LAYOUT_FRAME + layout_payload + FRAME_END
+    yield END_FRAME
 
 
 @router.post("/stream")
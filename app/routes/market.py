@@ -56,10 +56,13 @@ async def compare_assets(
     targets: list[str] = Query(..., description="Repeated query param, up to 10 items"),
 ):
     service = _get_market_service(request)
-    unique_targets = []
+    unique_targets: list[str] = []
+    seen: set[str] = set()
     for target in targets:
         symbol = target.strip()
-        if symbol and symbol.lower() not in [t.lower() for t in unique_targets]:
+        key = symbol.lower()
+        if symbol and key not in seen:
+            seen.add(key)
             unique_targets.append(symbol)
         if len(unique_targets) >= 10:
             break
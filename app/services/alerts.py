@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from math import ceil
+from operator import itemgetter
 from typing import Dict, List
 import uuid
 
@@ -19,15 +22,24 @@ class AlertService:
         market_service: MarketDataService,
         technical_service: TechnicalAnalysisService,
         portfolio_service: PortfolioService,
+        *,
+        max_workers: int = 4,
     ) -> None:
         self.store = store
         self.market_service = market_service
         self.technical_service = technical_service
         self.portfolio_service = portfolio_service
+        # Portfolio-wide alerts fetch one chart per holding; overlap those calls
+        # while keeping the fan-out small enough for CoinGecko's rate limit.
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="alerts"
+        )
+
+    def close(self) -> None:
+        """Stop the chart fan-out workers."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     def add_alert(self, user_id: str, description: str, condition: Dict) -> Dict:
-        state = self.store.get_user_state(user_id)
-        alerts = state.setdefault("alerts", [])
         alert = {
             "id": uuid.uuid4().hex,
             "description": description,
@@ -37,43 +49,62 @@ class AlertService:
             "last_observed": None,
             "triggered_at": None,
         }
-        alerts.append(alert)
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            state["alerts"].append(alert)
         return alert
 
     def delete_alert(self, user_id: str, alert_id: str) -> None:
-        state = self.store.get_user_state(user_id)
-        alerts = state.setdefault("alerts", [])
-        state["alerts"] = [alert for alert in alerts if alert.get("id") != alert_id]
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            state["alerts"] = [
+                alert for alert in state["alerts"] if alert.get("id") != alert_id
+            ]
 
     def list_alerts(self, user_id: str) -> List[Dict]:
         state = self.store.get_user_state(user_id)
-        return state.get("alerts", [])
+        return state["alerts"]
 
     def evaluate_alerts(self, user_id: str, currency: str) -> List[Dict]:
-        state = self.store.get_user_state(user_id)
-        alerts = state.get("alerts", [])
-        evaluated: list[dict] = []
+        # Evaluation makes network calls, so it runs on a snapshot outside the
+        # store lock; results are merged back by id so alerts added or deleted
+        # meanwhile are kept (or stay deleted).
+        alerts = self.store.get_user_state(user_id)["alerts"]
+        results: dict[str, Dict] = {}
+        # Alerts on the same asset/window share one chart fetch for this pass.
+        charts: dict[tuple[str, str, int], dict] = {}
+        now_iso = datetime.now(timezone.utc).isoformat()
         for alert in alerts:
             condition = alert.get("condition", {})
             if condition.get("type") == "price_move":
-                result = self._evaluate_price_alert(condition, currency, user_id)
+                result = self._evaluate_price_alert(
+                    condition, currency, user_id, charts, now_iso
+                )
             elif condition.get("type") == "indicator_threshold":
-                result = self._evaluate_indicator_alert(condition, currency)
+                result = self._evaluate_indicator_alert(condition, currency, now_iso)
             else:
                 result = {"status": "unsupported", "condition": condition}
-            alert["status"] = result.get("status", alert.get("status"))
-            alert["last_observed"] = result.get("observed_value")
-            if result.get("triggered_at"):
-                alert["triggered_at"] = result["triggered_at"]
-            alert["context"] = result.get("context")
-            evaluated.append(alert)
-        state["alerts"] = alerts
-        self.store.update_user_state(user_id, state)
+            results[alert.get("id")] = result
+        evaluated: list[dict] = []
+        with self.store.mutate(user_id) as state:
+            for alert in state["alerts"]:
+                result = results.get(alert.get("id"))
+                if result is None:
+                    continue
+                alert["status"] = result.get("status", alert.get("status"))
+                alert["last_observed"] = result.get("observed_value")
+                if result.get("triggered_at"):
+                    alert["triggered_at"] = result["triggered_at"]
+                alert["context"] = result.get("context")
+                evaluated.append(alert)
         return evaluated
 
-    def _evaluate_price_alert(self, condition: Dict, currency: str, user_id: str) -> Dict:
+    def _evaluate_price_alert(
+        self,
+        condition: Dict,
+        currency: str,
+        user_id: str,
+        charts: dict[tuple[str, str, int], dict],
+        now_iso: str,
+    ) -> Dict:
         direction = condition.get("direction", "drop")
         percentage = float(condition.get("percentage") or 0)
         asset = condition.get("asset") or "*"
@@ -81,12 +112,15 @@ class AlertService:
         targets: list[str]
         if asset == "*":
             snapshot = self.portfolio_service.summarize_portfolio(user_id, currency)
-            targets = [row["asset"] for row in snapshot.get("positions", [])]
+            # Several lots of one coin share a single chart lookup.
+            targets = list(dict.fromkeys(row["asset"] for row in snapshot.get("positions", [])))
         else:
             targets = [asset]
         triggered_assets: list[dict] = []
-        for symbol in targets:
-            change_pct, latest = self._price_change(symbol, currency, window)
+        changes = self._executor.map(
+            lambda symbol: self._price_change(symbol, currency, window, charts), targets
+        )
+        for symbol, (change_pct, latest) in zip(targets, changes):
             condition_met = (
                 change_pct <= -percentage if direction == "drop" else change_pct >= percentage
             )
@@ -98,7 +132,6 @@ class AlertService:
                         "price": latest,
                     }
                 )
-        now_iso = datetime.now(timezone.utc).isoformat()
         if triggered_assets:
             return {
                 "status": "triggered",
@@ -112,7 +145,7 @@ class AlertService:
             "context": {"checked_assets": targets},
         }
 
-    def _evaluate_indicator_alert(self, condition: Dict, currency: str) -> Dict:
+    def _evaluate_indicator_alert(self, condition: Dict, currency: str, now_iso: str) -> Dict:
         indicator = condition.get("indicator", "rsi")
         timeframe = condition.get("timeframe", "4h")
         operator = condition.get("operator", "lt")
@@ -128,7 +161,6 @@ class AlertService:
         triggered = False
         if value is not None:
             triggered = value < threshold if operator == "lt" else value > threshold
-        now_iso = datetime.now(timezone.utc).isoformat()
         return {
             "status": "triggered" if triggered else "armed",
             "observed_value": value,
@@ -136,18 +168,28 @@ class AlertService:
             "triggered_at": now_iso if triggered else None,
         }
 
-    def _price_change(self, asset: str, currency: str, window_minutes: int) -> tuple[float, float]:
-        resolved = self.market_service.resolve_symbol(asset)
+    def _price_change(
+        self,
+        asset: str,
+        currency: str,
+        window_minutes: int,
+        charts: dict[tuple[str, str, int], dict],
+    ) -> tuple[float, float]:
         days = max(1, ceil(window_minutes / (60 * 24)))
-        chart = self.market_service.client.get_market_chart(resolved, currency, days)
+        key = (asset.lower(), currency, days)
+        chart = charts.get(key)
+        if chart is None:
+            resolved = self.market_service.resolve_symbol(asset)
+            chart = self.market_service.client.get_market_chart(resolved, currency, days)
+            charts[key] = chart
         series = chart.get("prices", [])
         if not series:
             return 0.0, 0.0
         cutoff = series[-1][0] - window_minutes * 60 * 1000
-        window_series = [point for point in series if point[0] >= cutoff]
-        if len(window_series) < 2:
-            window_series = series[-2:]
-        start_price = window_series[0][1]
-        end_price = window_series[-1][1]
+        # Points are time-ordered, so locate the window start by bisection.
+        start = bisect_left(series, cutoff, key=itemgetter(0))
+        start = min(start, max(len(series) - 2, 0))
+        start_price = series[start][1]
+        end_price = series[-1][1]
         change_pct = ((end_price - start_price) / start_price * 100) if start_price else 0.0
         return change_pct, end_price
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Dict, Iterable, List, Sequence
 import logging
+import string
+import time
 
 import requests
 from requests import Response
 
+from ..cache import FileCache
+from .http import pooled_session
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,7 +53,16 @@ NEGATIVE_KEYWORDS = {
 }
 
 
-@dataclass(frozen=True)
+POSITIVE_SET = frozenset(POSITIVE_KEYWORDS)
+NEGATIVE_SET = frozenset(NEGATIVE_KEYWORDS)
+# Articles are matched on whole words: punctuation becomes whitespace, except
+# the hyphen that "sell-off" needs.
+PUNCTUATION_TO_SPACE = str.maketrans(
+    {char: " " for char in string.punctuation if char != "-"}
+)
+
+
+@dataclass(frozen=True, slots=True)
 class NewsItem:
     title: str
     url: str
@@ -65,22 +80,40 @@ class CryptoNewsService:
         base_url: str = "https://min-api.cryptocompare.com/data/v2/news/",
         api_key: str | None = None,
         timeout: int = 10,
+        session: requests.Session | None = None,
+        cache: FileCache | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self._cache: dict[tuple, tuple[float, list[NewsItem]]] = {}
         self.cache_ttl = 120.0
+        # Raw feed payloads also go to disk so a restarted worker starts warm.
+        self.disk_cache = cache
+        self.session = session or pooled_session()
+        self.session.headers["accept"] = "application/json"
+        if self.api_key:
+            self.session.headers["authorization"] = f"Apikey {self.api_key}"
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
 
     def _request(self, params: Dict) -> Dict:
-        headers = {"accept": "application/json"}
-        if self.api_key:
-            headers["authorization"] = f"Apikey {self.api_key}"
+        if self.disk_cache:
+            cached = self.disk_cache.get("cryptocompare/news", params)
+            if cached is not None:
+                return cached
+        payload = self._fetch(params)
+        if self.disk_cache:
+            self.disk_cache.set("cryptocompare/news", params, payload, self.cache_ttl)
+        return payload
+
+    def _fetch(self, params: Dict) -> Dict:
         try:
-            response: Response = requests.get(
+            response: Response = self.session.get(
                 self.base_url,
                 params=params,
-                headers=headers,
                 timeout=self.timeout,
             )
             response.raise_for_status()
@@ -101,7 +134,7 @@ class CryptoNewsService:
         normalized_assets = tuple(sorted({asset.lower() for asset in assets or []}))
         normalized_categories = tuple(sorted({cat.lower() for cat in categories or []}))
         cache_key = (limit, normalized_categories, normalized_assets)
-        now = datetime.now(timezone.utc).timestamp()
+        now = time.monotonic()
         cached = self._cache.get(cache_key)
         if cached and now - cached[0] < self.cache_ttl:
             return cached[1]
@@ -150,17 +183,13 @@ class CryptoNewsService:
         if not items:
             return {"score": 0.0, "label": "neutral", "keywords": []}
         score = 0
-        keyword_hits: dict[str, int] = {}
+        keyword_hits: Counter[str] = Counter()
         for item in items:
-            text = f"{item.title} {item.body}".lower()
-            for token in POSITIVE_KEYWORDS:
-                if token in text:
-                    score += 1
-                    keyword_hits[token] = keyword_hits.get(token, 0) + 1
-            for token in NEGATIVE_KEYWORDS:
-                if token in text:
-                    score -= 1
-                    keyword_hits[token] = keyword_hits.get(token, 0) + 1
+            tokens = f"{item.title} {item.body}".lower().translate(PUNCTUATION_TO_SPACE).split()
+            positive = POSITIVE_SET.intersection(tokens)
+            negative = NEGATIVE_SET.intersection(tokens)
+            score += len(positive) - len(negative)
+            keyword_hits.update(sorted(positive | negative))
         normalized = score / max(len(items), 1)
         if normalized > 0.75:
             label = "strongly positive"
@@ -172,7 +201,7 @@ class CryptoNewsService:
             label = "negative"
         else:
             label = "neutral"
-        top_keywords = sorted(keyword_hits.items(), key=lambda kv: kv[1], reverse=True)[:3]
+        top_keywords = keyword_hits.most_common(3)
         return {
             "score": round(normalized, 2),
             "label": label,
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Dict
 import logging
+import time
 
 import requests
 from requests import Response
 
+from ..cache import FileCache
+from .http import pooled_session
+
 logger = logging.getLogger(__name__)
 
 
-NETWORK_MAP = {
+NETWORK_MAP = MappingProxyType({
     "btc": "bitcoin",
     "bitcoin": "bitcoin",
     "eth": "ethereum",
@@ -23,7 +27,20 @@ NETWORK_MAP = {
     "dogecoin": "dogecoin",
     "bch": "bitcoin-cash",
     "bitcoin-cash": "bitcoin-cash",
-}
+})
+
+
+COVERAGE_FIELDS = (
+    "market_cap_usd",
+    "largest_transaction_24h",
+    "mempool_transactions",
+    "transactions_24h",
+    "hodling_addresses",
+)
+
+
+def _coverage(stats: Dict) -> int:
+    return sum(1 for field in COVERAGE_FIELDS if stats.get(field))
 
 
 class OnChainService:
@@ -34,24 +51,46 @@ class OnChainService:
         base_url: str = "https://api.blockchair.com",
         api_key: str | None = None,
         timeout: int = 10,
+        session: requests.Session | None = None,
+        cache: FileCache | None = None,
     ) -> None:
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
-        self._cache: dict[str, tuple[float, dict]] = {}
+        # network -> (checked_at, snapshot, field coverage, fetched_at); the two
+        # times differ while a richer snapshot is held over a partial refresh.
+        self._cache: dict[str, tuple[float, dict, int, float]] = {}
         self.cache_ttl = 180.0
+        # Raw stats payloads also go to disk so a restarted worker starts warm.
+        self.disk_cache = cache
+        self.session = session or pooled_session()
+        self.session.headers["accept"] = "application/json"
+
+    def close(self) -> None:
+        """Release pooled connections."""
+        self.session.close()
 
     def _resolve_network(self, asset: str) -> str:
-        symbol = (asset or "").lower()
-        if symbol in NETWORK_MAP:
-            return NETWORK_MAP[symbol]
+        network = NETWORK_MAP.get((asset or "").lower())
+        if network:
+            return network
         raise ValueError(f"On-chain data is not available for {asset}.")
 
     def _request(self, network: str) -> Dict:
+        if self.disk_cache:
+            cached = self.disk_cache.get("blockchair/stats", network)
+            if cached is not None:
+                return cached
+        payload = self._fetch(network)
+        if self.disk_cache:
+            self.disk_cache.set("blockchair/stats", network, payload, self.cache_ttl)
+        return payload
+
+    def _fetch(self, network: str) -> Dict:
         url = f"{self.base_url}/{network}/stats"
         params = {"key": self.api_key} if self.api_key else None
         try:
-            response: Response = requests.get(url, params=params, timeout=self.timeout)
+            response: Response = self.session.get(url, params=params, timeout=self.timeout)
             response.raise_for_status()
         except requests.HTTPError as exc:
             logger.warning("Blockchair request failed network=%s status=%s", network, exc.response.status_code if exc.response else "?")
@@ -61,7 +100,7 @@ class OnChainService:
     def snapshot(self, asset: str) -> dict:
         network = self._resolve_network(asset)
         cache_key = network
-        now = datetime.now(timezone.utc).timestamp()
+        now = time.monotonic()
         cached = self._cache.get(cache_key)
         if cached and now - cached[0] < self.cache_ttl:
             return cached[1]
@@ -69,6 +108,20 @@ class OnChainService:
         payload = self._request(network)
         stats = payload.get("data", {})
         context = payload.get("context", {})
+        coverage = _coverage(stats)
+        if cached and coverage < cached[2] and now - cached[3] < 2 * self.cache_ttl:
+            # Blockchair occasionally returns partial stats; keep the richer
+            # snapshot for one extra TTL instead of degrading the signals. A
+            # field that stays missing (or a counter that is really 0) is
+            # accepted once the old snapshot is two TTLs past its fetch.
+            logger.warning(
+                "Blockchair stats for %s cover %s/%s fields; keeping previous snapshot",
+                network,
+                coverage,
+                cached[2],
+            )
+            self._cache[cache_key] = (now, cached[1], cached[2], cached[3])
+            return cached[1]
 
         market_cap = float(stats.get("market_cap_usd") or 0.0)
         largest_tx = stats.get("largest_transaction_24h") or {}
@@ -122,5 +175,5 @@ class OnChainService:
             },
             "best_block_time": stats.get("best_block_time") or context.get("time"),
         }
-        self._cache[cache_key] = (now, snapshot)
+        self._cache[cache_key] = (now, snapshot, coverage, now)
         return snapshot
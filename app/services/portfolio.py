@@ -1,52 +1,116 @@
-"""Persistent portfolio + watchlist helpers backed by a JSON store."""
+"""Persistent portfolio + watchlist helpers backed by a SQLite store."""
 
 from __future__ import annotations
 
-import json
+import sqlite3
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List
+import logging
 import threading
 import uuid
 
+import orjson
+
 from ..market import MarketDataService
 
+logger = logging.getLogger(__name__)
+
+STORE_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=3000;
+CREATE TABLE IF NOT EXISTS user_state (
+    user_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+
+def _complete_state(state: Dict) -> Dict:
+    """Fill in any missing sections so callers can index the shape directly."""
+
+    state.setdefault("portfolio", {}).setdefault("positions", [])
+    state.setdefault("watchlist", [])
+    state.setdefault("alerts", [])
+    return state
+
 
 class AgentDataStore:
-    """Minimal JSON store (thread-safe) for user specific data."""
+    """Thread-safe per-user state documents, one SQLite row per user.
+
+    Reads and writes touch only the caller's row, so a mutation no longer
+    re-parses and rewrites every user's data. A path ending in ``.json`` is
+    treated as the legacy single-file store: the database lives next to it
+    with a ``.db`` suffix and the JSON users are imported on first open.
+    """
 
     def __init__(self, path: Path) -> None:
-        self.path = Path(path)
+        path = Path(path)
+        legacy_path = path if path.suffix == ".json" else path.with_suffix(".json")
+        self.path = path.with_suffix(".db") if path.suffix == ".json" else path
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        self._lock = threading.Lock()
-        if not self.path.exists():
-            self._write({"users": {}})
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.executescript(STORE_SCHEMA)
+        if legacy_path.exists():
+            self._import_legacy(legacy_path)
 
-    def _read(self) -> Dict:
+    def _import_legacy(self, legacy_path: Path) -> None:
         with self._lock:
+            if self._conn.execute("SELECT 1 FROM user_state LIMIT 1").fetchone():
+                return
             try:
-                data = json.loads(self.path.read_text(encoding="utf-8"))
-            except json.JSONDecodeError:
-                data = {"users": {}}
-            return data
+                users = orjson.loads(legacy_path.read_bytes()).get("users", {})
+            except (OSError, orjson.JSONDecodeError, AttributeError):
+                return
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO user_state (user_id, state) VALUES (?, ?)",
+                [(user_id, orjson.dumps(state).decode()) for user_id, state in users.items()],
+            )
+        logger.info("Imported %s users from legacy store %s", len(users), legacy_path)
 
-    def _write(self, data: Dict) -> None:
+    def close(self) -> None:
         with self._lock:
-            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            self._conn.close()
 
     def get_user_state(self, user_id: str) -> Dict:
-        data = self._read()
-        users = data.setdefault("users", {})
-        state = users.setdefault(
-            user_id,
-            {"portfolio": {"positions": []}, "watchlist": [], "alerts": []},
-        )
-        return state
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT state FROM user_state WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        return _complete_state(orjson.loads(row[0]) if row else {})
 
     def update_user_state(self, user_id: str, state: Dict) -> None:
-        data = self._read()
-        data.setdefault("users", {})[user_id] = state
-        self._write(data)
+        payload = orjson.dumps(state).decode()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO user_state (user_id, state) VALUES (?, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET state = excluded.state",
+                (user_id, payload),
+            )
+
+    @contextmanager
+    def mutate(self, user_id: str) -> Iterator[Dict]:
+        """Yield ``user_id``'s state for in-place edits, saved atomically on exit.
+
+        The read and the write share one transaction (and the store lock), so
+        concurrent edits to the same user cannot overwrite each other.
+        """
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                state = self.get_user_state(user_id)
+                yield state
+                self.update_user_state(user_id, state)
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
 
 
 class PortfolioService:
@@ -57,8 +121,6 @@ class PortfolioService:
         self.market_service = market_service
 
     def add_position(self, user_id: str, asset: str, amount: float, cost_basis: float) -> Dict:
-        state = self.store.get_user_state(user_id)
-        positions: list[dict] = state.setdefault("portfolio", {}).setdefault("positions", [])
         position = {
             "id": uuid.uuid4().hex,
             "asset": asset.lower(),
@@ -66,40 +128,38 @@ class PortfolioService:
             "cost_basis": cost_basis,
             "added_at": datetime.now(timezone.utc).isoformat(),
         }
-        positions.append(position)
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            state["portfolio"]["positions"].append(position)
         return position
 
     def delete_position(self, user_id: str, position_id: str) -> None:
-        state = self.store.get_user_state(user_id)
-        positions = state.setdefault("portfolio", {}).setdefault("positions", [])
-        state["portfolio"]["positions"] = [pos for pos in positions if pos.get("id") != position_id]
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            portfolio = state["portfolio"]
+            portfolio["positions"] = [
+                pos for pos in portfolio["positions"] if pos.get("id") != position_id
+            ]
 
     def add_watch_asset(self, user_id: str, asset: str) -> List[str]:
-        state = self.store.get_user_state(user_id)
-        watchlist = state.setdefault("watchlist", [])
         symbol = asset.lower()
-        if symbol not in watchlist:
-            watchlist.append(symbol)
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            watchlist = state["watchlist"]
+            if symbol not in watchlist:
+                watchlist.append(symbol)
         return watchlist
 
     def remove_watch_asset(self, user_id: str, asset: str) -> List[str]:
-        state = self.store.get_user_state(user_id)
-        watchlist = state.setdefault("watchlist", [])
         symbol = asset.lower()
-        state["watchlist"] = [item for item in watchlist if item != symbol]
-        self.store.update_user_state(user_id, state)
+        with self.store.mutate(user_id) as state:
+            state["watchlist"] = [item for item in state["watchlist"] if item != symbol]
         return state["watchlist"]
 
     def get_watchlist(self, user_id: str) -> List[str]:
         state = self.store.get_user_state(user_id)
-        return state.get("watchlist", [])
+        return state["watchlist"]
 
     def summarize_portfolio(self, user_id: str, currency: str) -> Dict:
         state = self.store.get_user_state(user_id)
-        positions = state.get("portfolio", {}).get("positions", [])
+        positions = state["portfolio"]["positions"]
         assets = sorted({pos["asset"] for pos in positions})
         quotes = self._fetch_quotes(assets, currency)
         rows = []
@@ -147,10 +207,12 @@ class PortfolioService:
             "positions": rows,
             "totals": totals,
             "breakdown": breakdown,
-            "watchlist": state.get("watchlist", []),
+            "watchlist": state["watchlist"],
         }
 
     def _fetch_quotes(self, assets: List[str], currency: str):
+        # A stale position on a delisted coin should not blank the whole book.
+        assets = [asset for asset in assets if self.market_service.is_supported(asset)]
         if not assets:
             return {}
         quotes = self.market_service.summarize_prices(assets, currency)
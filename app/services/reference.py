@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-REFERENCE_METRICS = {
+from types import MappingProxyType
+
+REFERENCE_METRICS = MappingProxyType({
     "bitcoin": {
         "transaction_speed_tps": 7,
         "finality": "10 min",
@@ -66,6 +68,11 @@ REFERENCE_METRICS = {
         "category": "social",
         "narrative": "Telegram-native chain with consumer distribution.",
     },
+})
+
+# CoinGecko ids are already lower-case, so the pulse can look these up directly.
+CATEGORY_BY_ID: dict[str, str] = {
+    asset_id: metrics.get("category", "other") for asset_id, metrics in REFERENCE_METRICS.items()
 }
 
 
@@ -2,43 +2,77 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import itemgetter
 from typing import Dict, List, Sequence
+import heapq
 import logging
 import time
 
 import requests
 
+from ..cache import FileCache, TTLCache
 from ..market import MarketDataService
+from .http import pooled_session
 from .news import CryptoNewsService
-from .reference import get_reference
+from .reference import CATEGORY_BY_ID, get_reference
 
 logger = logging.getLogger(__name__)
 
 
+def _change_24h(coin: dict) -> float:
+    return coin.get("price_change_percentage_24h_in_currency") or 0
+
+
 class MarketPulseService:
-    def __init__(self, market_service: MarketDataService, news_service: CryptoNewsService) -> None:
+    def __init__(
+        self,
+        market_service: MarketDataService,
+        news_service: CryptoNewsService,
+        session: requests.Session | None = None,
+        cache: FileCache | None = None,
+    ) -> None:
         self.market_service = market_service
         self.news_service = news_service
+        self.session = session or pooled_session()
+        self.disk_cache = cache
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="pulse")
         self._fear_cache: tuple[float, dict] | None = None
         self.fear_cache_ttl = 600.0
+        # Dashboards poll the pulse; a short TTL absorbs back-to-back loads.
+        self._pulse_cache = TTLCache(maxsize=8, ttl=30)
+
+    def close(self) -> None:
+        """Stop the fan-out workers and release pooled connections."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.session.close()
 
     def build_pulse(self, currency: str) -> dict:
-        markets = self.market_service.fetch_markets(currency, per_page=50)
-        global_stats = self.market_service.get_global_snapshot(currency)
-        gainers = sorted(
-            markets,
-            key=lambda coin: coin.get("price_change_percentage_24h_in_currency") or 0,
-            reverse=True,
-        )[:3]
-        losers = sorted(
-            markets,
-            key=lambda coin: coin.get("price_change_percentage_24h_in_currency") or 0,
-        )[:3]
+        cached = self._pulse_cache.get(currency)
+        if cached is not None:
+            return cached
+        pulse = self._build_pulse(currency)
+        self._pulse_cache[currency] = pulse
+        return pulse
+
+    def _build_pulse(self, currency: str) -> dict:
+        # The four upstream calls are independent (three different hosts), so
+        # the pulse costs the slowest of them rather than their sum.
+        markets_future = self._executor.submit(
+            self.market_service.fetch_markets, currency, per_page=50
+        )
+        global_future = self._executor.submit(self.market_service.get_global_snapshot, currency)
+        news_future = self._executor.submit(self.news_service.fetch_news, limit=3)
+        fear_future = self._executor.submit(self._fetch_fear_greed)
+        markets = markets_future.result()
+        global_stats = global_future.result()
+        gainers = heapq.nlargest(3, markets, key=_change_24h)
+        losers = heapq.nsmallest(3, markets, key=_change_24h)
         categories = self._category_performance(markets)
-        news_items = self.news_service.fetch_news(limit=3)
+        news_items = news_future.result()
         sentiment = self.news_service.summarize_sentiment(news_items)
-        fear_greed = self._fetch_fear_greed()
+        fear_greed = fear_future.result()
         return {
             "global": global_stats,
             "gainers": _slim_markets(gainers),
@@ -62,8 +96,7 @@ class MarketPulseService:
     def _category_performance(self, markets: Sequence[dict]) -> List[dict]:
         buckets: dict[str, dict] = {}
         for coin in markets:
-            ref = get_reference(coin.get("id", ""))
-            category = ref.get("category") if ref else "other"
+            category = CATEGORY_BY_ID.get(coin.get("id", ""), "other")
             bucket = buckets.setdefault(
                 category,
                 {"category": category, "market_cap": 0.0, "avg_change": 0.0, "count": 0},
@@ -77,11 +110,15 @@ class MarketPulseService:
         return sorted(buckets.values(), key=lambda item: item["market_cap"], reverse=True)[:6]
 
     def _fetch_fear_greed(self) -> dict:
-        now = time.time()
+        now = time.monotonic()
         if self._fear_cache and now - self._fear_cache[0] < self.fear_cache_ttl:
             return self._fear_cache[1]
+        gauge = self.disk_cache.get("alternative/fng", "latest") if self.disk_cache else None
+        if gauge is not None:
+            self._fear_cache = (now, gauge)
+            return gauge
         try:
-            response = requests.get(
+            response = self.session.get(
                 "https://api.alternative.me/fng/?limit=1&format=json", timeout=8
             )
             response.raise_for_status()
@@ -92,6 +129,8 @@ class MarketPulseService:
                 "classification": data.get("value_classification", "Neutral"),
                 "updated_at": datetime.now(timezone.utc).isoformat(),
             }
+            if self.disk_cache:
+                self.disk_cache.set("alternative/fng", "latest", gauge, self.fear_cache_ttl)
         except requests.RequestException:
             gauge = {"value": 50, "classification": "Neutral", "updated_at": None}
         self._fear_cache = (now, gauge)
@@ -130,17 +169,25 @@ class AdvancedComparisonService:
         }
 
 
+_SLIM_SOURCE_FIELDS = (
+    "id",
+    "symbol",
+    "name",
+    "current_price",
+    "price_change_percentage_24h_in_currency",
+    "market_cap",
+)
+_SLIM_KEYS = ("id", "symbol", "name", "price", "change_24h", "market_cap")
+_slim_fields = itemgetter(*_SLIM_SOURCE_FIELDS)
+
+
 def _slim_markets(entries: Sequence[dict]) -> List[dict]:
     results = []
     for coin in entries:
-        results.append(
-            {
-                "id": coin.get("id"),
-                "symbol": coin.get("symbol"),
-                "name": coin.get("name"),
-                "price": coin.get("current_price"),
-                "change_24h": coin.get("price_change_percentage_24h_in_currency"),
-                "market_cap": coin.get("market_cap"),
-            }
-        )
+        try:
+            values = _slim_fields(coin)
+        except KeyError:
+            # /coins/markets always carries these keys; tolerate odd rows anyway.
+            values = tuple(coin.get(field) for field in _SLIM_SOURCE_FIELDS)
+        results.append(dict(zip(_SLIM_KEYS, values)))
     return results
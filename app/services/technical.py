@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import List, Tuple
+from itertools import pairwise
+from typing import List
 
 from ..market import MarketDataService
 
@@ -37,11 +38,12 @@ class TechnicalAnalysisService:
         chart = self.market_service.client.get_market_chart(symbol, currency, days)
         prices = chart.get("prices", [])
         candles = self._build_candles(prices, minutes)
-        closes = [candle["close"] for candle in candles]
         value = None
         interpretation = "insufficient data"
         state = "unknown"
-        if indicator.lower() == "rsi" and len(closes) >= period + 2:
+        if indicator.lower() == "rsi" and len(candles) >= period + 2:
+            # RSI only reads the trailing window, so skip the older candles.
+            closes = [candle["close"] for candle in candles[-(period + 15):]]
             value = self._compute_rsi(closes, period)
             if value >= 70:
                 state = "overbought"
@@ -69,9 +71,13 @@ class TechnicalAnalysisService:
         bucket_ms = bucket_minutes * 60 * 1000
         candles: list[dict] = []
         current_bucket = None
+        candle: dict = {}
+        high = low = 0.0
         for timestamp, price in prices:
             bucket = int(timestamp // bucket_ms * bucket_ms)
             if current_bucket != bucket:
+                if candles:
+                    candle["high"], candle["low"] = high, low
                 candle = {
                     "timestamp": datetime.fromtimestamp(bucket / 1000, tz=timezone.utc).isoformat(),
                     "open": price,
@@ -81,17 +87,21 @@ class TechnicalAnalysisService:
                 }
                 candles.append(candle)
                 current_bucket = bucket
+                high = low = price
             else:
-                candle = candles[-1]
-                candle["high"] = max(candle["high"], price)
-                candle["low"] = min(candle["low"], price)
+                # Track extremes in locals; the dict is only touched for close.
+                if price > high:
+                    high = price
+                elif price < low:
+                    low = price
                 candle["close"] = price
+        candle["high"], candle["low"] = high, low
         return candles
 
     def _compute_rsi(self, closes: List[float], period: int) -> float:
         gains = []
         losses = []
-        for prev, curr in self._pairwise(closes[-(period + 15):]):
+        for prev, curr in pairwise(closes[-(period + 15):]):
             change = curr - prev
             (gains if change > 0 else losses).append(abs(change))
         avg_gain = sum(gains[-period:]) / period if gains[-period:] else 0.0
@@ -101,6 +111,3 @@ class TechnicalAnalysisService:
         rs = avg_gain / avg_loss
         rsi = 100 - (100 / (1 + rs))
         return round(rsi, 2)
-
-    def _pairwise(self, sequence: List[float]) -> List[Tuple[float, float]]:
-        return list(zip(sequence[:-1], sequence[1:]))
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from typing import List
 import logging
 
 from langchain_core.tools import tool
 
+from .cache import CacheBackend, memoize
 from .market import MarketDataError, MarketDataService
 from .services import (
     AlertService,
@@ -21,24 +24,18 @@ from .services import (
 logger = logging.getLogger(__name__)
 
 
+QUOTE_FIELDS = ("asset", "currency", "price", "change_24h", "market_cap")
+TRENDING_FIELDS = ("name", "symbol", "score", "slug")
+_quote_values = attrgetter(*QUOTE_FIELDS)
+_trending_values = attrgetter(*TRENDING_FIELDS)
+
+
 def _serialize_quotes(quotes):
-    return [
-        {
-            "asset": quote.asset,
-            "currency": quote.currency,
-            "price": quote.price,
-            "change_24h": quote.change_24h,
-            "market_cap": quote.market_cap,
-        }
-        for quote in quotes
-    ]
+    return [dict(zip(QUOTE_FIELDS, values)) for values in map(_quote_values, quotes)]
 
 
 def _serialize_trending(entries):
-    return [
-        {"name": item.name, "symbol": item.symbol, "score": item.score, "slug": item.slug}
-        for item in entries
-    ]
+    return [dict(zip(TRENDING_FIELDS, values)) for values in map(_trending_values, entries)]
 
 
 def build_market_tools(
@@ -51,15 +48,27 @@ def build_market_tools(
     alert_service: AlertService,
     pulse_service: MarketPulseService,
     comparison_service: AdvancedComparisonService,
+    executor: ThreadPoolExecutor,
+    shared_cache: CacheBackend | None = None,
 ):
-    """Return the full list of LangChain tools backed by market + user services."""
+    """Return the full list of LangChain tools backed by market + user services.
+
+    ``executor`` runs the upstream fan-out inside composite tools; the caller
+    owns it and shuts it down with the graph.
+    """
+
+    # Idempotent lookups are shared across workers when a shared cache is
+    # configured (asset_overview already caches itself in MarketDataService).
+    build_pulse = memoize(shared_cache, "tool:market_pulse", 30)(pulse_service.build_pulse)
+    fundamentals = memoize(shared_cache, "tool:fundamentals", 300)(market_service.fundamentals_snapshot)
+    onchain_snapshot = memoize(shared_cache, "tool:onchain", 120)(onchain_service.snapshot)
 
     @tool("market_pulse")
     def market_pulse(currency: str = "usd") -> dict:
         """Return a global view of market cap, movers, news, and sentiment."""
 
         try:
-            return pulse_service.build_pulse(currency)
+            return build_pulse(currency)
         except Exception as exc:  # pragma: no cover - defensive
             logger.warning("market_pulse failed: %s", exc)
             return {"error": str(exc)}
@@ -68,14 +77,21 @@ def build_market_tools(
     def asset_intel(asset: str, currency: str = "usd") -> dict:
         """Return price, fundamentals, news, sentiment, and on-chain context for an asset."""
 
+        # CoinGecko, CryptoCompare and Blockchair are independent upstreams;
+        # overlap them so the tool costs the slowest call, not the sum.
+        overview_future = executor.submit(
+            market_service.asset_overview, asset, currency, lookback_days=7
+        )
+        news_future = executor.submit(news_service.fetch_for_asset, asset, limit=3)
+        onchain_future = executor.submit(onchain_snapshot, asset)
         try:
-            overview = market_service.asset_overview(asset, currency, lookback_days=7)
+            overview = overview_future.result()
         except (ValueError, MarketDataError) as exc:
             return {"error": str(exc)}
-        news_items = news_service.fetch_for_asset(asset, limit=3)
+        news_items = news_future.result()
         sentiment = news_service.summarize_sentiment(news_items)
         try:
-            onchain = onchain_service.snapshot(asset)
+            onchain = onchain_future.result()
         except ValueError:
             onchain = None
 
@@ -174,8 +190,8 @@ def build_market_tools(
         """Return recent price, market cap, and volume stats for the asset."""
 
         try:
-            snapshot = market_service.fundamentals_snapshot(asset, currency, lookback_days)
-        except MarketDataError as exc:
+            snapshot = fundamentals(asset, currency, lookback_days)
+        except (ValueError, MarketDataError) as exc:
             logger.warning("fundamentals_snapshot failed: %s", exc)
             return {"error": str(exc)}
         logger.info("fundamentals_snapshot asset=%s currency=%s", asset, currency)
@@ -197,7 +213,7 @@ def build_market_tools(
         """Return whale + network growth heuristics for BTC/ETH-family chains."""
 
         try:
-            return onchain_service.snapshot(asset)
+            return onchain_snapshot(asset)
         except ValueError as exc:
             return {"error": str(exc)}
 
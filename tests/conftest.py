@@ -95,18 +95,19 @@ class StubMarketService:
     def resolve_symbol(self, asset):
         return asset
 
+    def is_supported(self, asset):
+        return True
+
     def fundamentals_snapshot(self, asset, currency, lookback_days=7):
-        series_point = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "value": 100.0,
-        }
+        now = datetime.now(timezone.utc).isoformat()
+        series_point = {"timestamp": now, "value": 100.0}
         return {
             "asset": asset,
             "currency": currency,
             "price_stats": {"avg": 100.0, "min": 95.0, "max": 105.0},
             "market_cap_stats": {"avg": 200.0, "min": 190.0, "max": 210.0},
             "volume_stats": {"avg": 300.0, "min": 250.0, "max": 320.0},
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": now,
             "series": {
                 "prices": [series_point],
                 "market_caps": [series_point],
@@ -133,7 +134,7 @@ class StubMarketService:
             "ath_change_pct": -2.0,
             "atl_price": 65.0,
             "atl_change_pct": 99999.0,
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+            "last_updated": fundamentals["last_updated"],
             "fundamentals": fundamentals,
             "sparkline": [p["value"] for p in fundamentals["series"]["prices"]],
             "series": fundamentals["series"],
@@ -184,6 +185,14 @@ class StubPulseService:
         }
 
 
+# The stubs hold no state, so every test app can share one instance of each;
+# only the settings and SQLite path are per test.
+STUB_MARKET_SERVICE = StubMarketService()
+STUB_NEWS_SERVICE = StubNewsService()
+STUB_ONCHAIN_SERVICE = StubOnChainService()
+STUB_PULSE_SERVICE = StubPulseService()
+
+
 @pytest.fixture(scope="session")
 def event_loop():
     loop = asyncio.new_event_loop()
@@ -202,18 +211,14 @@ def test_app(tmp_path):
         google_api_key=None,
     )
     test_llm = TestingToolAwareChatModel(responses=["Mock crypto insight."])
-    market_service = StubMarketService()
-    news_service = StubNewsService()
-    onchain_service = StubOnChainService()
-    pulse_service = StubPulseService()
     app = create_app(
         settings_override=settings,
         llm_override=test_llm,
-        market_service_override=market_service,
+        market_service_override=STUB_MARKET_SERVICE,
     )
-    app.state.market_service = market_service
-    app.state.news_service = news_service
-    app.state.onchain_service = onchain_service
-    app.state.pulse_service = pulse_service
+    app.state.market_service = STUB_MARKET_SERVICE
+    app.state.news_service = STUB_NEWS_SERVICE
+    app.state.onchain_service = STUB_ONCHAIN_SERVICE
+    app.state.pulse_service = STUB_PULSE_SERVICE
     with TestClient(app) as client:
         yield client
@@ -0,0 +1,43 @@
+import asyncio
+
+from langchain_core.messages import HumanMessage
+
+from app import agent
+from app.agent import LLMBatcher
+
+
+class CountingChatModel(agent.TestingToolAwareChatModel):
+    batch_sizes: list = []
+
+    async def abatch(self, inputs, config=None, **kwargs):
+        self.batch_sizes.append(len(inputs))
+        return await super().abatch(inputs, config, **kwargs)
+
+
+def test_llm_batcher_coalesces_turns_behind_an_inflight_batch():
+    llm = CountingChatModel(responses=["one", "two", "three"])
+    batcher = LLMBatcher(llm, batch_size=8, window_ms=10)
+
+    async def scenario():
+        return await asyncio.gather(
+            *(batcher.ainvoke([HumanMessage(content=str(i))], {}) for i in range(3))
+        )
+
+    results = asyncio.run(scenario())
+
+    assert [result.content for result in results] == ["one", "two", "three"]
+    # The first turn finds nothing in flight and goes out alone; the others
+    # arrive while it runs and share one batch.
+    assert llm.batch_sizes == [1, 2]
+
+
+def test_llm_batcher_dispatches_lone_turn_without_waiting():
+    llm = CountingChatModel(responses=["solo"])
+    llm.batch_sizes = []
+    batcher = LLMBatcher(llm, batch_size=8, window_ms=5_000)
+
+    async def scenario():
+        return await asyncio.wait_for(batcher.ainvoke([HumanMessage(content="hi")], {}), 1)
+
+    assert asyncio.run(scenario()).content == "solo"
+    assert llm.batch_sizes == [1]
@@ -140,3 +140,148 @@ def test_portfolio_and_alert_flow(test_app):
     alerts = test_app.get(f"/api/user/{user_id}/alerts")
     assert alerts.status_code == 200
     assert alerts.json()["alerts"]
+
+
+def test_checkpoint_db_uses_wal(test_app):
+    import sqlite3
+
+    db_path = test_app.app.state.settings.sqlite_path
+    with sqlite3.connect(db_path) as conn:
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+
+async def _run_checkpoint_loop(path, hold_reader=False):
+    import asyncio
+
+    import aiosqlite
+
+    from app.main import SQLITE_PRAGMAS, SQLITE_TRUNCATE_PRAGMAS, _checkpoint_loop
+
+    wal = path.with_name(path.name + "-wal")
+    conn = await aiosqlite.connect(str(path))
+    await conn.executescript(SQLITE_PRAGMAS)
+    await conn.execute("CREATE TABLE t (v TEXT)")
+    await conn.executemany("INSERT INTO t VALUES (?)", [("x" * 500,)] * 200)
+    await conn.commit()
+    truncate_conn = await aiosqlite.connect(str(path))
+    await truncate_conn.executescript(SQLITE_TRUNCATE_PRAGMAS)
+    reader = await aiosqlite.connect(str(path))
+    if hold_reader:
+        # An open read transaction keeps TRUNCATE from resetting the WAL.
+        await reader.execute("BEGIN")
+        await (await reader.execute("SELECT count(*) FROM t")).fetchone()
+    wal_before = wal.stat().st_size
+    lock = asyncio.Lock()
+    task = asyncio.create_task(_checkpoint_loop(conn, lock, 0.01, truncate_conn))
+    await asyncio.sleep(0.1)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    async with lock:
+        lock_wait = loop.time() - started
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
+    wal_after = wal.stat().st_size
+    for connection in (reader, truncate_conn, conn):
+        await connection.close()
+    return wal_before, wal_after, lock_wait
+
+
+def test_checkpoint_loop_truncates_large_wal(tmp_path, monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr("app.main.WAL_TRUNCATE_PAGES", 1)
+    wal_before, wal_after, _ = asyncio.run(_run_checkpoint_loop(tmp_path / "wal.db"))
+    assert wal_before > 0
+    assert wal_after == 0
+
+
+def test_checkpoint_truncate_does_not_stall_writers_behind_readers(tmp_path, monkeypatch):
+    import asyncio
+
+    monkeypatch.setattr("app.main.WAL_TRUNCATE_PAGES", 1)
+    wal_before, wal_after, lock_wait = asyncio.run(
+        _run_checkpoint_loop(tmp_path / "wal.db", hold_reader=True)
+    )
+    assert wal_after == wal_before
+    assert lock_wait < 0.5
+
+
+def test_chat_thread_history_survives_pooled_reads(test_app):
+    first = test_app.post("/api/chat", json={"message": "One", "thread_id": "pool"})
+    second = test_app.post("/api/chat", json={"message": "Two", "thread_id": "pool"})
+    assert first.status_code == second.status_code == 200
+    assert (
+        second.json()["metadata"]["message_count"]
+        > first.json()["metadata"]["message_count"]
+    )
+
+
+def test_cors_echoes_only_allowed_origins(test_app):
+    allowed = test_app.get("/health", headers={"Origin": "http://localhost:5173"})
+    denied = test_app.get("/health", headers={"Origin": "https://evil.example"})
+    assert allowed.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert "access-control-allow-origin" not in denied.headers
+
+
+def test_shutdown_waits_for_market_warm_up(tmp_path, monkeypatch):
+    import time
+
+    from fastapi.testclient import TestClient
+
+    from app.agent import TestingToolAwareChatModel
+    from app.config import Settings
+    from app.main import create_app
+    from app.market import CoinGeckoClient
+
+    from conftest import StubMarketService
+
+    events = []
+
+    class WarmingMarketService(StubMarketService):
+        def warm_up(self):
+            time.sleep(0.2)
+            events.append("warmed")
+
+    monkeypatch.setattr(CoinGeckoClient, "close", lambda self: events.append("closed"))
+    settings = Settings(
+        testing=False,
+        sqlite_db_path=str(tmp_path / "agent.db"),
+        data_store_path=str(tmp_path / "agent_state.db"),
+        cache_dir=str(tmp_path / "cache"),
+        google_api_key=None,
+    )
+    app = create_app(
+        settings_override=settings,
+        llm_override=TestingToolAwareChatModel(responses=["ok"]),
+        market_service_override=WarmingMarketService(),
+    )
+    with TestClient(app):
+        pass
+    assert events == ["warmed", "closed"]
+
+
+def test_lifespan_teardown_shuts_down_service_pools(tmp_path):
+    from fastapi.testclient import TestClient
+
+    from app.agent import TestingToolAwareChatModel
+    from app.config import Settings
+    from app.main import create_app
+
+    settings = Settings(
+        testing=True,
+        sqlite_db_path=str(tmp_path / "agent.db"),
+        data_store_path=str(tmp_path / "agent_state.db"),
+        cache_dir=str(tmp_path / "cache"),
+        google_api_key=None,
+    )
+    app = create_app(
+        settings_override=settings, llm_override=TestingToolAwareChatModel(responses=["ok"])
+    )
+    with TestClient(app):
+        pass
+    assert app.state.market_service._executor._shutdown
+    assert app.state.alert_service._executor._shutdown
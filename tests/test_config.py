@@ -0,0 +1,32 @@
+import logging
+
+from app import config, logging_config
+from app.main import create_app
+
+
+def test_dotenv_log_level_applies_to_app_logging(tmp_path, monkeypatch):
+    (tmp_path / ".env").write_text(
+        "\n".join(
+            [
+                "LOG_LEVEL=debug",
+                f"SQLITE_DB_PATH={tmp_path / 'agent.db'}",
+                f"DATA_STORE_PATH={tmp_path / 'agent_state.db'}",
+                f"CACHE_DIR={tmp_path / 'cache'}",
+            ]
+        )
+    )
+    for name in ("LOG_LEVEL", "SQLITE_DB_PATH", "DATA_STORE_PATH", "CACHE_DIR", "SKIP_DOTENV"):
+        # setenv first so monkeypatch restores whatever load_dotenv writes.
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    monkeypatch.setattr(config, "ROOT_DIR", tmp_path)
+    monkeypatch.setattr(logging_config, "_CONFIGURED", False)
+    root = logging.getLogger()
+    previous_level = root.level
+    config.get_settings.cache_clear()
+    try:
+        create_app()
+        assert root.level == logging.DEBUG
+    finally:
+        config.get_settings.cache_clear()
+        root.setLevel(previous_level)
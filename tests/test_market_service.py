@@ -1,8 +1,12 @@
+import pytest
+
 from app.market import MarketDataService
 from app.models import PriceQuote, TrendingCoin
 
 
 class StubClient:
+    timeout = 10
+
     def __init__(self):
         self.simple_price_calls = []
 
@@ -13,6 +17,9 @@ class StubClient:
             PriceQuote(asset="ethereum", currency=currency, price=3400.0, change_24h=-0.5, market_cap=4.1e11),
         ]
 
+    def get_simple_price_map(self, assets, currency):
+        return {quote.asset: quote for quote in self.get_simple_price(assets, currency)}
+
     def get_trending(self):
         return [
             TrendingCoin(name="Bitcoin", symbol="BTC", score=0, slug="bitcoin"),
@@ -27,6 +34,9 @@ class StubClient:
         ]
         return {"prices": base, "market_caps": base, "total_volumes": base}
 
+    def get_ohlc_chart(self, asset, currency, days):
+        return [[0, 100, 110, 90, 105], [1, 105, 120, 100, 115]]
+
     def list_coins(self):
         return [
             {"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"},
@@ -40,8 +50,9 @@ class StubClient:
             "symbol": "btc",
             "name": "Bitcoin",
             "market_data": {
-                "current_price": {"usd": 100.0},
+                "current_price": {"usd": 100.0, "eur": 92.0},
                 "price_change_percentage_24h": 1.5,
+                "price_change_percentage_24h_in_currency": {"usd": 1.5, "eur": 0.8},
                 "market_cap": {"usd": 2_000_000},
                 "total_volume": {"usd": 500_000},
                 "market_cap_rank": 1,
@@ -64,6 +75,13 @@ def test_summarize_prices_returns_quotes():
     assert quotes[0].asset == "bitcoin"
 
 
+def test_compare_assets_fetches_all_ids_in_one_call():
+    service = MarketDataService(StubClient())
+    comparisons = service.compare_assets("BTC", ["ETH"], "usd")
+    assert service.client.simple_price_calls == [(("bitcoin", "ethereum"), "usd")]
+    assert comparisons[0].spread == 68000.0 - 3400.0
+
+
 def test_trending_returns_items():
     service = MarketDataService(StubClient())
     trending = service.get_trending()
@@ -71,6 +89,16 @@ def test_trending_returns_items():
     assert trending[0].symbol == "BTC"
 
 
+def test_trending_is_served_from_cache_within_ttl():
+    service = MarketDataService(StubClient())
+    calls = []
+    fetch = service.client.get_trending
+    service.client.get_trending = lambda: calls.append(1) or fetch()
+    service.get_trending()
+    service.get_trending()
+    assert len(calls) == 1
+
+
 def test_fundamentals_snapshot_has_stats():
     service = MarketDataService(StubClient())
     snapshot = service.fundamentals_snapshot("bitcoin", "usd", 3)
@@ -87,6 +115,186 @@ def test_symbol_resolution_prefers_primary_coin():
 def test_asset_overview_merges_detail_and_fundamentals():
     service = MarketDataService(StubClient())
     overview = service.asset_overview("bitcoin", "usd", 3)
-    assert overview["price"] == 68000.0  # from simple price stub
+    assert overview["price"] == 100.0  # from coin detail market data
+    assert overview["change_24h"] == 1.5
+    assert service.client.simple_price_calls == []
     assert overview["fundamentals"]["price_stats"]["avg"] == 200.0
     assert overview["circulating_supply"] == 19000000
+
+
+def test_summarize_prices_memoizes_and_serves_stale_quotes():
+    from app.market import MarketDataError
+
+    service = MarketDataService(StubClient())
+    service.summarize_prices(["btc", "eth"], "usd")
+    service.summarize_prices(["eth"], "usd")
+    assert len(service.client.simple_price_calls) == 1
+
+    def failing(assets, currency):
+        raise MarketDataError("rate limited")
+
+    service.price_cache_ttl = 0
+    service.client.get_simple_price = failing
+    quotes = service.summarize_prices(["btc"], "usd")
+    assert quotes[0].price == 68000.0
+
+
+def test_coingecko_client_persists_coin_list(tmp_path):
+    import requests
+
+    from app.cache import FileCache
+    from app.market import CoinGeckoClient
+
+    class FakeResponse:
+        status_code = 200
+        content = b'[{"id": "bitcoin", "symbol": "btc", "name": "Bitcoin"}]'
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            import json
+
+            return json.loads(self.content)
+
+    class CountingSession(requests.Session):
+        calls = 0
+
+        def get(self, *args, **kwargs):
+            CountingSession.calls += 1
+            return FakeResponse()
+
+    cache = FileCache(tmp_path)
+    first = CoinGeckoClient("https://example.test", session=CountingSession(), cache=cache)
+    second = CoinGeckoClient("https://example.test", session=CountingSession(), cache=cache)
+
+    assert first.list_coins() == second.list_coins()
+    assert CountingSession.calls == 1
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    from app.cache import TTLCache
+
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.cache_info()["size"] == 2
+
+
+def test_known_ids_resolve_without_registry_download():
+    client = StubClient()
+    client.list_coins = lambda: (_ for _ in ()).throw(AssertionError("registry loaded"))
+    service = MarketDataService(client)
+    assert service.resolve_symbol("btc") == "bitcoin"
+    assert service.resolve_symbol("ethereum") == "ethereum"
+
+
+def test_unknown_asset_is_rejected_without_upstream_call():
+    service = MarketDataService(StubClient())
+    with pytest.raises(ValueError):
+        service.summarize_prices(["notacoin"], "usd")
+    assert service.client.simple_price_calls == []
+    assert not service.is_supported("notacoin")
+
+
+def test_memoize_serves_repeat_calls_from_backend():
+    from app.cache import memoize
+
+    class DictBackend:
+        def __init__(self):
+            self.data = {}
+
+        def get(self, key):
+            return self.data.get(key)
+
+        def set(self, key, value, ttl):
+            self.data[key] = value
+
+        def delete(self, key):
+            self.data.pop(key, None)
+
+    service = MarketDataService(StubClient())
+    calls = []
+    fetch = service.client.get_market_chart
+    service.client.get_market_chart = lambda *args: calls.append(args) or fetch(*args)
+    snapshot = memoize(DictBackend(), "tool:fundamentals", 300)(service.fundamentals_snapshot)
+    first = snapshot("bitcoin", "usd", 3)
+    assert snapshot("bitcoin", "usd", 3) == first
+    assert len(calls) == 1
+    assert memoize(None, "tool:fundamentals", 300)(len) is len
+
+
+def test_concurrent_overviews_share_one_upstream_build():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    service = MarketDataService(StubClient())
+    release = threading.Event()
+    calls = []
+    detail = service.client.get_coin_detail
+
+    def slow_detail(asset):
+        calls.append(asset)
+        release.wait(timeout=5)
+        return detail(asset)
+
+    service.client.get_coin_detail = slow_detail
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(service.asset_overview, "btc", "usd", 3) for _ in range(2)]
+        while not calls:
+            release.wait(timeout=0.01)
+        release.set()
+        first, second = (future.result() for future in futures)
+    assert calls == ["bitcoin"]
+    assert first is second
+
+
+def test_file_cache_treats_truncated_entry_as_miss(tmp_path):
+    from app.cache import FileCache
+
+    cache = FileCache(tmp_path)
+    cache.set("coingecko/coins", "list", [{"id": "bitcoin"}] * 50, ttl=60)
+    path = cache._path("coingecko/coins", "list")
+    path.write_bytes(path.read_bytes()[:20])
+    assert cache.get("coingecko/coins", "list") is None
+
+
+def test_coalesced_waiter_builds_itself_when_builder_stalls():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    service = MarketDataService(StubClient())
+    service.client.timeout = 0.05
+    release = threading.Event()
+    started = threading.Event()
+
+    def build(value):
+        if not started.is_set():
+            started.set()
+            release.wait(timeout=5)
+        return value
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        stalled = pool.submit(service._coalesce, ("test",), build, "owner")
+        started.wait(timeout=5)
+        assert service._coalesce(("test",), build, "waiter") == "waiter"
+        release.set()
+        assert stalled.result() == "owner"
+
+
+def test_asset_overview_reports_change_in_requested_currency():
+    service = MarketDataService(StubClient())
+    overview = service.asset_overview("bitcoin", "eur", 3)
+    assert overview["price"] == 92.0
+    assert overview["change_24h"] == 0.8
+
+
+def test_close_stops_fan_out_workers():
+    service = MarketDataService(StubClient())
+    service.close()
+    with pytest.raises(RuntimeError):
+        service._executor.submit(print)
@@ -0,0 +1,16 @@
+from app.services.news import CryptoNewsService, NewsItem
+
+
+def _item(title: str) -> NewsItem:
+    return NewsItem(title=title, url="", source="", published_at="", categories=[], body="")
+
+
+def test_sentiment_matches_whole_words_only():
+    service = CryptoNewsService()
+
+    summary = service.summarize_sentiment(
+        [_item("Bank stocks rally after the sell-off."), _item("Urban miners report record output")]
+    )
+
+    assert set(summary["keywords"]) == {"rally", "sell-off", "record"}
+    assert summary["score"] == 0.5
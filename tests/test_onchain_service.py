@@ -0,0 +1,47 @@
+from app.services import onchain
+from app.services.onchain import OnChainService
+
+FULL_STATS = {
+    "market_cap_usd": 1_000_000,
+    "largest_transaction_24h": {"value_usd": 5_000},
+    "mempool_transactions": 300,
+    "transactions_24h": 1_000,
+    "hodling_addresses": 42,
+}
+PARTIAL_STATS = {"market_cap_usd": 1_000_000}
+
+
+def _service_with_clock(monkeypatch, payloads):
+    clock = [1_000.0]
+    monkeypatch.setattr(onchain.time, "monotonic", lambda: clock[0])
+    service = OnChainService()
+    service.cache_ttl = 10
+    service._request = lambda network: payloads.pop(0)
+    return service, clock
+
+
+def test_partial_stats_do_not_replace_richer_snapshot(monkeypatch):
+    payloads = [{"data": FULL_STATS}, {"data": PARTIAL_STATS}]
+    service, clock = _service_with_clock(monkeypatch, payloads)
+
+    first = service.snapshot("btc")
+    clock[0] += 11
+    second = service.snapshot("btc")
+
+    assert second == first
+    assert second["network_growth"]["hodling_addresses"] == 42
+
+
+def test_degraded_stats_are_accepted_after_one_extra_ttl(monkeypatch):
+    payloads = [{"data": FULL_STATS}, {"data": PARTIAL_STATS}, {"data": PARTIAL_STATS}]
+    service, clock = _service_with_clock(monkeypatch, payloads)
+
+    service.snapshot("btc")
+    clock[0] += 11
+    held = service.snapshot("btc")
+    clock[0] += 11
+    degraded = service.snapshot("btc")
+
+    assert held["network_growth"]["hodling_addresses"] == 42
+    assert degraded["network_growth"]["hodling_addresses"] == 0
+    assert payloads == []
@@ -0,0 +1,76 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.portfolio import AgentDataStore
+
+
+def test_store_round_trips_user_state(tmp_path):
+    store = AgentDataStore(tmp_path / "state.db")
+    assert store.get_user_state("alice")["watchlist"] == []
+
+    state = store.get_user_state("alice")
+    state["watchlist"].append("btc")
+    store.update_user_state("alice", state)
+
+    assert store.get_user_state("alice")["watchlist"] == ["btc"]
+    assert store.get_user_state("bob")["watchlist"] == []
+
+
+def test_store_imports_legacy_json_file(tmp_path):
+    legacy = tmp_path / "agent_state.json"
+    legacy.write_text(
+        json.dumps({"users": {"alice": {"portfolio": {"positions": []}, "watchlist": ["eth"], "alerts": []}}}),
+        encoding="utf-8",
+    )
+
+    store = AgentDataStore(legacy)
+
+    assert store.path == tmp_path / "agent_state.db"
+    assert store.get_user_state("alice")["watchlist"] == ["eth"]
+
+
+def test_mutate_serializes_concurrent_edits(tmp_path):
+    store = AgentDataStore(tmp_path / "state.db")
+
+    def add(symbol):
+        with store.mutate("alice") as state:
+            state["watchlist"].append(symbol)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add, [f"coin{i}" for i in range(40)]))
+
+    assert len(store.get_user_state("alice")["watchlist"]) == 40
+
+
+def test_mutate_discards_edits_on_error(tmp_path):
+    store = AgentDataStore(tmp_path / "state.db")
+    try:
+        with store.mutate("alice") as state:
+            state["watchlist"].append("btc")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+
+    assert store.get_user_state("alice")["watchlist"] == []
+
+
+def test_alert_added_during_evaluation_is_kept(tmp_path):
+    from app.services.alerts import AlertService
+
+    store = AgentDataStore(tmp_path / "state.db")
+    service = AlertService(store, None, None, None)
+    existing = service.add_alert("alice", "rsi", {"type": "indicator_threshold"})
+
+    def evaluate_while_user_adds(condition, currency, now_iso):
+        # Stands in for the network-bound evaluation window.
+        service.add_alert("alice", "new", {"type": "price_move", "asset": "btc"})
+        return {"status": "triggered", "observed_value": 25.0, "triggered_at": now_iso}
+
+    service._evaluate_indicator_alert = evaluate_while_user_adds
+    evaluated = service.evaluate_alerts("alice", "usd")
+
+    assert [alert["id"] for alert in evaluated] == [existing["id"]]
+    stored = store.get_user_state("alice")["alerts"]
+    assert [alert["description"] for alert in stored] == ["rsi", "new"]
+    assert stored[0]["status"] == "triggered"
+    assert stored[1]["status"] == "armed"
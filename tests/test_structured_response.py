@@ -1,5 +1,12 @@
-from app.routes.chat import _ensure_structured, _determine_asset
-from app.models import UIComponent
+import asyncio
+
+from app.routes.chat import (
+    COMPONENT_HYDRATORS,
+    _determine_asset,
+    _ensure_structured,
+    _hydrate_structured,
+)
+from app.models import AgentStructuredResponse, UIComponent
 
 
 def test_ensure_structured_parses_code_fenced_json():
@@ -23,6 +30,41 @@ def test_ensure_structured_handles_json_prefix_without_fence():
     assert structured.responses[0].content == "ok"
 
 
+def test_ensure_structured_extracts_json_between_prose():
+    raw = 'Here you go: {"summary": "wrapped", "responses": []} Hope that helps!'
+
+    structured = _ensure_structured(raw)
+
+    assert structured.summary == "wrapped"
+    assert structured.responses == []
+
+
+def test_ensure_structured_keeps_prose_with_embedded_object_as_text():
+    raw = 'Try {"asset": "btc"} next'
+
+    structured = _ensure_structured(raw)
+
+    assert structured.summary == raw
+    assert structured.responses[0].type == "text"
+    assert structured.responses[0].content == raw
+
+
+def test_ensure_structured_treats_empty_object_as_text():
+    structured = _ensure_structured("{}")
+
+    assert structured.summary == "{}"
+    assert structured.responses[0].content == "{}"
+
+
+def test_ensure_structured_keeps_fences_inside_bare_json():
+    raw = '{"summary": "code", "responses": [{"type": "text", "content": "```py\\nx = 1\\n```"}]}'
+
+    structured = _ensure_structured(raw)
+
+    assert structured.summary == "code"
+    assert structured.responses[0].content == "```py\nx = 1\n```"
+
+
 def test_ensure_structured_fallback_strips_fences():
     raw = """```json
     this is not json at all
@@ -52,3 +94,28 @@ def test_ensure_structured_allows_specialized_components():
 def test_determine_asset_extracts_from_content():
     component = UIComponent(type="asset_intel", content="Here's a quick read on Ethereum (ETH).")
     assert _determine_asset(component) == "eth"
+
+
+def test_determine_asset_skips_unknown_upper_case_words():
+    component = UIComponent(type="asset_intel", content="ETF flows keep lifting BTC this week.")
+    assert _determine_asset(component) == "btc"
+
+
+def test_hydrate_structured_isolates_failing_components(monkeypatch):
+    def hydrate(component, state):
+        if component.content == "boom":
+            raise RuntimeError("upstream down")
+        return {"hydrated": component.content}
+
+    monkeypatch.setitem(COMPONENT_HYDRATORS, "table", hydrate)
+    structured = AgentStructuredResponse(
+        responses=[
+            UIComponent(type="table", content="ok", data={"raw": True}),
+            UIComponent(type="table", content="boom", data={"raw": True}),
+        ]
+    )
+
+    asyncio.run(_hydrate_structured(structured, state=None))
+
+    assert structured.responses[0].data == {"hydrated": "ok"}
+    assert structured.responses[1].data == {"raw": True}